@@ -1,6 +1,31 @@
 import sys
 
-from ._ast import *
+from ._ast import (
+    Assignment,
+    BinOp,
+    Boolean,
+    Break,
+    ConstDecl,
+    Continue,
+    ExprAsStatement,
+    Float,
+    FuncArg,
+    FuncCall,
+    FuncDef,
+    IfElse,
+    Integer,
+    LogicalOp,
+    Name,
+    Node,
+    ParenExpr,
+    PrintStatement,
+    Return,
+    Statements,
+    Type,
+    UnaryOp,
+    VarDecl,
+    While,
+)
 from ._format import format
 
 
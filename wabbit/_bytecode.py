@@ -0,0 +1,365 @@
+"""Lowers a Wabbit AST into flat bytecode and runs it on a small stack machine.
+
+The tree-walking `_Interpreter` re-dispatches on every AST node each time a
+`while` loop body is executed. Lowering once to a flat `list[tuple]` of opcodes
+lets the hot loop become a single `while pc < len(code)` with an `if/elif`
+chain on a plain int - no recursion, no per-node method calls and no boxed
+value types: the value stack holds raw Python `int`/`float`/`bool`/`str`.
+
+Variable names are resolved to integer slot indices at compile time, so an
+execution frame is just a `list` indexed by slot instead of a `dict` keyed by
+name.
+
+`_Interpreter` remains as the reference implementation.
+"""
+
+import typing as t
+
+from ._ast import *
+from ._errors import WabbitRuntimeError
+
+# Opcodes. Argument layout is noted next to each one.
+OP_CONST = 1  # (OP_CONST, value): push a literal
+OP_LOAD = 2  # (OP_LOAD, slot, name): push a variable value; name is for errors
+OP_STORE = 3  # (OP_STORE, slot): store top-of-stack into a slot (does not pop)
+OP_POP = 4  # (OP_POP,): discard top-of-stack
+OP_ADD = 5  # (OP_ADD,)
+OP_SUB = 6  # (OP_SUB,)
+OP_MUL = 7  # (OP_MUL,)
+OP_DIV = 8  # (OP_DIV,): `int(a / b)` when both operands are ints
+OP_NEG = 9  # (OP_NEG,)
+OP_NOT = 10  # (OP_NOT,)
+OP_CMP = 11  # (OP_CMP, "=="|"!="|"<"|"<="|">"|">="): push comparison result
+OP_JMP = 12  # (OP_JMP, target_pc)
+OP_JMP_IF_FALSE = 13  # (OP_JMP_IF_FALSE, target_pc): pops the condition
+OP_JMP_IF_FALSE_OR_POP = 14  # short-circuit `&&`: jump keeping the value or pop
+OP_JMP_IF_TRUE_OR_POP = 15  # short-circuit `||`: jump keeping the value or pop
+OP_PRINT = 16  # (OP_PRINT,): pop and print
+OP_MAKE_FUNC = 17  # (OP_MAKE_FUNC, _Func): define a function
+OP_CALL = 18  # (OP_CALL, name, nargs): call a previously defined function
+OP_RETURN = 19  # (OP_RETURN,): pop and return from the current frame
+
+
+class Code:
+    """A compiled block of bytecode: the top-level program or a function body."""
+
+    def __init__(self, ops: list[tuple], nslots: int) -> None:
+        self.ops = ops
+        self.nslots = nslots
+
+
+class _Func:
+    def __init__(self, name: str, nargs: int, code: Code) -> None:
+        self.name = name
+        self.nargs = nargs
+        self.code = code
+
+
+def interpret(ast: Node) -> None:
+    """Compile the AST to bytecode and run it."""
+    run(compile(ast))
+
+
+def compile(ast: Node) -> Code:
+    """Lower the given AST into a flat opcode list."""
+    codegen = _CodeGen()
+    codegen.visit(ast)
+    return codegen.code()
+
+
+_CMP_OPS = ("==", "!=", "<", "<=", ">", ">=")
+
+
+class _CodeGen(Visitor):
+    """Emits bytecode for one scope: the program top level or a function body.
+
+    Wabbit functions only see their own arguments and locals, so each function
+    body is compiled by a fresh `_CodeGen` with its own slot numbering.
+    """
+
+    def __init__(self, arg_names: t.Sequence[str] = ()) -> None:
+        super().__init__()
+        self._ops: list[tuple] = []
+        self._slots: dict[str, int] = {name: i for i, name in enumerate(arg_names)}
+        # Jump targets to patch once the enclosing loop end is known:
+        # a stack of (break_positions, continue_target) per nested loop.
+        self._loops: list[tuple[list[int], int]] = []
+
+    def code(self) -> Code:
+        return Code(self._ops, nslots=len(self._slots))
+
+    def visit_Integer(self, node: Integer) -> None:
+        self._ops.append((OP_CONST, node.num))
+
+    def visit_Float(self, node: Float) -> None:
+        self._ops.append((OP_CONST, node.num))
+
+    def visit_Boolean(self, node: Boolean) -> None:
+        self._ops.append((OP_CONST, node.value))
+
+    def visit_Character(self, node: Character) -> None:
+        self._ops.append((OP_CONST, node.value))
+
+    def visit_Name(self, node: Name) -> None:
+        self._ops.append((OP_LOAD, self._slot(node.value), node.value))
+
+    def visit_PrintStatement(self, node: PrintStatement) -> None:
+        self.visit(node.value)
+        self._ops.append((OP_PRINT,))
+
+    def visit_BinOp(self, node: BinOp) -> None:
+        self.visit(node.left)
+        self.visit(node.right)
+        match node.operation:
+            case "+":
+                self._ops.append((OP_ADD,))
+            case "-":
+                self._ops.append((OP_SUB,))
+            case "*":
+                self._ops.append((OP_MUL,))
+            case "/":
+                self._ops.append((OP_DIV,))
+
+    def visit_UnaryOp(self, node: UnaryOp) -> None:
+        self.visit(node.operand)
+        match node.operation:
+            case "-":
+                self._ops.append((OP_NEG,))
+            case "!":
+                self._ops.append((OP_NOT,))
+            case "+":
+                pass
+
+    def visit_LogicalOp(self, node: LogicalOp) -> None:
+        if node.operation in _CMP_OPS:
+            self.visit(node.left)
+            self.visit(node.right)
+            self._ops.append((OP_CMP, node.operation))
+            return
+
+        # `&&` and `||` short-circuit: the right operand is only evaluated when
+        # the left one does not already decide the result.
+        self.visit(node.left)
+        jmp_op = (
+            OP_JMP_IF_FALSE_OR_POP if node.operation == "&&" else OP_JMP_IF_TRUE_OR_POP
+        )
+        jmp_pos = self._emit_jump(jmp_op)
+        self.visit(node.right)
+        self._patch_jump(jmp_pos)
+
+    def visit_ParenExpr(self, node: ParenExpr) -> None:
+        self.visit(node.value)
+
+    def visit_Statements(self, node: Statements) -> None:
+        for n in node.nodes:
+            self.visit(n)
+
+    def visit_ExprAsStatement(self, node: ExprAsStatement) -> None:
+        self.visit(node.expr)
+        self._ops.append((OP_POP,))
+
+    def visit_VarDecl(self, node: VarDecl) -> None:
+        if node.value:
+            self.visit(node.value)
+        else:
+            self._ops.append((OP_CONST, _default_value(node)))
+        self._store_and_pop(self._declare(node.name.value))
+
+    def visit_ConstDecl(self, node: ConstDecl) -> None:
+        self.visit(node.value)
+        self._store_and_pop(self._declare(node.name.value))
+
+    def visit_Assignment(self, node: Assignment) -> None:
+        assert isinstance(node.left, Name)
+        self.visit(node.right)
+        # Assignment is an expression: the value stays on the stack.
+        self._ops.append((OP_STORE, self._slot(node.left.value)))
+
+    def visit_IfElse(self, node: IfElse) -> None:
+        self.visit(node.test)
+        else_jmp = self._emit_jump(OP_JMP_IF_FALSE)
+        self.visit(node.body)
+
+        if node.else_body:
+            end_jmp = self._emit_jump(OP_JMP)
+            self._patch_jump(else_jmp)
+            self.visit(node.else_body)
+            self._patch_jump(end_jmp)
+        else:
+            self._patch_jump(else_jmp)
+
+    def visit_While(self, node: While) -> None:
+        test_pc = len(self._ops)
+        self.visit(node.test)
+        exit_jmp = self._emit_jump(OP_JMP_IF_FALSE)
+
+        break_positions: list[int] = []
+        self._loops.append((break_positions, test_pc))
+        self.visit(node.body)
+        self._loops.pop()
+
+        self._ops.append((OP_JMP, test_pc))
+        self._patch_jump(exit_jmp)
+        for pos in break_positions:
+            self._patch_jump(pos)
+
+    def visit_Break(self, node: Break) -> None:
+        break_positions, _ = self._loops[-1]
+        break_positions.append(self._emit_jump(OP_JMP))
+
+    def visit_Continue(self, node: Continue) -> None:
+        _, continue_target = self._loops[-1]
+        self._ops.append((OP_JMP, continue_target))
+
+    def visit_FuncDef(self, node: FuncDef) -> None:
+        body_gen = _CodeGen(arg_names=[a.name.value for a in node.args])
+        body_gen.visit(node.body)
+        func = _Func(node.name.value, nargs=len(node.args), code=body_gen.code())
+        self._ops.append((OP_MAKE_FUNC, func))
+
+    def visit_FuncCall(self, node: FuncCall) -> None:
+        for arg in node.args:
+            self.visit(arg)
+        self._ops.append((OP_CALL, node.name.value, len(node.args)))
+
+    def visit_Return(self, node: Return) -> None:
+        self.visit(node.value)
+        self._ops.append((OP_RETURN,))
+
+    def _declare(self, name: str) -> int:
+        if name in self._slots:
+            raise WabbitRuntimeError(f"Variable '{name}' was already declared.")
+        slot = len(self._slots)
+        self._slots[name] = slot
+        return slot
+
+    def _slot(self, name: str) -> int:
+        try:
+            return self._slots[name]
+        except KeyError:
+            raise WabbitRuntimeError(f"Undefined variable '{name}'")
+
+    def _store_and_pop(self, slot: int) -> None:
+        self._ops.append((OP_STORE, slot))
+        self._ops.append((OP_POP,))
+
+    def _emit_jump(self, op: int) -> int:
+        """Emit a jump with a placeholder target; returns its position for patching."""
+        self._ops.append((op, -1))
+        return len(self._ops) - 1
+
+    def _patch_jump(self, pos: int) -> None:
+        self._ops[pos] = (self._ops[pos][0], len(self._ops))
+
+
+def run(code: Code) -> t.Any:
+    """The VM dispatch loop; also used for each function call frame."""
+    return _run_frame(code, [None] * code.nslots, {})
+
+
+def _run_frame(code: Code, slots: list, functions: dict[str, _Func]) -> t.Any:
+    ops = code.ops
+    nops = len(ops)
+    stack: list = []
+    pc = 0
+
+    while pc < nops:
+        inst = ops[pc]
+        pc += 1
+        op = inst[0]
+
+        if op == OP_LOAD:
+            # Slots are pre-sized with None; a None read means the variable's
+            # declaration sat in a branch that was skipped at run time.
+            if (value := slots[inst[1]]) is None:
+                raise WabbitRuntimeError(f"Undefined variable '{inst[2]}'")
+            stack.append(value)
+        elif op == OP_CONST:
+            stack.append(inst[1])
+        elif op == OP_STORE:
+            slots[inst[1]] = stack[-1]
+        elif op == OP_POP:
+            stack.pop()
+        elif op == OP_ADD:
+            right = stack.pop()
+            stack[-1] = stack[-1] + right
+        elif op == OP_SUB:
+            right = stack.pop()
+            stack[-1] = stack[-1] - right
+        elif op == OP_MUL:
+            right = stack.pop()
+            stack[-1] = stack[-1] * right
+        elif op == OP_DIV:
+            right = stack.pop()
+            left = stack[-1]
+            if type(left) is int and type(right) is int:
+                stack[-1] = int(left / right)
+            else:
+                stack[-1] = left / right
+        elif op == OP_CMP:
+            right = stack.pop()
+            left = stack[-1]
+            cmp = inst[1]
+            if cmp == "==":
+                stack[-1] = left == right
+            elif cmp == "!=":
+                stack[-1] = left != right
+            elif cmp == "<":
+                stack[-1] = left < right
+            elif cmp == "<=":
+                stack[-1] = left <= right
+            elif cmp == ">":
+                stack[-1] = left > right
+            else:
+                stack[-1] = left >= right
+        elif op == OP_JMP:
+            pc = inst[1]
+        elif op == OP_JMP_IF_FALSE:
+            if not stack.pop():
+                pc = inst[1]
+        elif op == OP_JMP_IF_FALSE_OR_POP:
+            if not stack[-1]:
+                pc = inst[1]
+            else:
+                stack.pop()
+        elif op == OP_JMP_IF_TRUE_OR_POP:
+            if stack[-1]:
+                pc = inst[1]
+            else:
+                stack.pop()
+        elif op == OP_NEG:
+            stack[-1] = -stack[-1]
+        elif op == OP_NOT:
+            stack[-1] = not stack[-1]
+        elif op == OP_PRINT:
+            print(stack.pop(), end="")
+        elif op == OP_MAKE_FUNC:
+            func = inst[1]
+            functions[func.name] = func
+        elif op == OP_CALL:
+            func = functions[inst[1]]
+            nargs = inst[2]
+            func_slots = [None] * func.code.nslots
+            func_slots[:nargs] = stack[len(stack) - nargs :]
+            del stack[len(stack) - nargs :]
+            stack.append(_run_frame(func.code, func_slots, functions))
+        elif op == OP_RETURN:
+            return stack.pop()
+        else:
+            raise WabbitRuntimeError(f"Unknown opcode {op}")
+
+    return None
+
+
+def _default_value(node: VarDecl) -> int | float | bool | str:
+    match node.type_:
+        case Type(name="int"):
+            return 0
+        case Type(name="float"):
+            return 0.0
+        case Type(name="bool"):
+            return False
+        case Type(name="char"):
+            return "\0"
+        case _:
+            assert False, f"Unknown variable type: {node.type_}"
@@ -0,0 +1,319 @@
+"""Translates Wabbit functions into Python source code.
+
+Wabbit's int/float/bool/char semantics map almost 1:1 to Python's, so instead
+of walking a function's AST on every call we can rewrite it into an equivalent
+Python `def`, `compile()` it once and let CPython's C-level eval loop run it.
+
+The only semantic mismatch is integer division (`int(a / b)` in Wabbit), which
+goes through the `_wb_div` helper injected into the execution environment.
+
+Translation is best-effort: `codegen_function` raises `Unsupported` when it
+meets a node it cannot rewrite (e.g. a call to a not-yet-compiled function)
+and the caller falls back to tree-walking interpretation.
+"""
+
+import dataclasses
+import keyword
+import typing as t
+
+from ._ast import *
+
+
+class Unsupported(Exception):
+    """The AST contains a node this code generator cannot translate."""
+
+
+def _py_name(name: str) -> str:
+    """Identifiers are emitted verbatim into the generated source, so a
+    Wabbit name that happens to be a Python keyword (`pass`, `class`, ...)
+    cannot be translated."""
+    if keyword.iskeyword(name):
+        raise Unsupported(f"'{name}' is a Python keyword")
+    return name
+
+
+def compile_function(
+    name: str,
+    arg_names: t.Sequence[str],
+    body: Statements,
+    env: dict[str, t.Any],
+) -> t.Callable:
+    """Translate a Wabbit function into a Python callable defined in `env`.
+
+    `env` doubles as the lookup table for already compiled Wabbit functions:
+    calls to any other name raise `Unsupported`.
+    """
+    src = codegen_function(name, arg_names, body, known_functions=set(env) | {name})
+    env.setdefault("_wb_div", _wb_div)
+    exec(_compile(src, f"<wabbit:{name}>"), env)
+    return env[name]
+
+
+def compile_program(ast: Statements) -> t.Callable[[], None]:
+    """Translate a whole program into one Python code object.
+
+    Used by `runit --bytecode`: the entire module - function definitions and
+    top-level statements - becomes a single `compile()`d code object, so the
+    run pays no Visitor dispatch at all. Raises `Unsupported` when any node
+    cannot be translated; the caller falls back to the interpreter.
+    """
+    codegen = _PyCodeGen([], known_functions=set())
+    codegen._indent_level = 0
+    src = "\n".join(codegen.visit(ast) or ["pass"])
+    code = _compile(src, "<wabbit:program>")
+
+    def run() -> None:
+        exec(code, {"_wb_div": _wb_div})
+
+    return run
+
+
+_loop_counter = 0
+
+
+def compile_loop(
+    node: While,
+    env: dict[str, t.Any],
+) -> tuple[t.Callable, tuple[int, ...], tuple[str, ...]]:
+    """Translate a `while` loop into a Python function over its variables.
+
+    Loops outside any function never go through `compile_function`, yet they
+    are where interpreted programs spend their time. The generated function
+    takes every variable the loop touches (by slot order), runs the loop
+    natively and returns the updated values as a tuple; the caller writes
+    them back into its slot list.
+
+    Returns the callable plus the slot indices and names of its parameters
+    (the names are for error reporting in the caller).
+    """
+    global _loop_counter
+    variables = _collect_slots(node)
+    # Parameters in slot order so the caller can zip values back in.
+    by_slot = sorted(variables.items(), key=lambda kv: kv[1])
+    names = [name for name, _ in by_slot]
+
+    codegen = _PyCodeGen(names, known_functions=set(env), allow_return=False)
+    lines = [f"    while {codegen.visit(node.test)}:"]
+    codegen._indent_level = 2
+    lines.extend(codegen.visit(node.body) or ["        pass"])
+
+    _loop_counter += 1
+    fn_name = f"_wb_loop{_loop_counter}"
+    src = "\n".join(
+        [f"def {fn_name}({', '.join(names)}):"]
+        + lines
+        + [f"    return ({', '.join(names)}{',' if len(names) == 1 else ''})"]
+    )
+    env.setdefault("_wb_div", _wb_div)
+    exec(_compile(src, f"<wabbit:{fn_name}>"), env)
+    return env[fn_name], tuple(slot for _, slot in by_slot), tuple(names)
+
+
+def _compile(src: str, filename: str) -> t.Any:
+    """`compile()` the generated source, folding failures into `Unsupported`.
+
+    Codegen aims to emit valid Python for every program it accepts, but a
+    miss has to mean fallback to the interpreter, never a raw SyntaxError."""
+    try:
+        return compile(src, filename, "exec")
+    except (SyntaxError, ValueError) as e:
+        raise Unsupported(f"generated source does not compile: {e}") from e
+
+
+def _collect_slots(node: Node, out: dict[str, int] | None = None) -> dict[str, int]:
+    """Gather every resolved variable (name -> slot) a subtree reads or writes."""
+    if out is None:
+        out = {}
+    if isinstance(node, Name) and node.slot is not None:
+        out[node.value] = node.slot
+    if isinstance(node, FuncDef):
+        # Slot indices inside a function body belong to the function's own
+        # scope; mixing them in here would make the caller write the loop's
+        # results back into unrelated outer-scope slots.
+        return out
+    for f in dataclasses.fields(node):
+        value = getattr(node, f.name)
+        if isinstance(value, Node):
+            _collect_slots(value, out)
+        elif isinstance(value, (tuple, list)):
+            for item in value:
+                if isinstance(item, Node):
+                    _collect_slots(item, out)
+    return out
+
+
+def codegen_function(
+    name: str,
+    arg_names: t.Sequence[str],
+    body: Statements,
+    known_functions: set[str],
+) -> str:
+    codegen = _PyCodeGen(arg_names, known_functions)
+    body_lines = codegen.visit(body) or ["    pass"]
+    header = f"def {_py_name(name)}({', '.join(arg_names)}):"
+    return "\n".join([header] + body_lines)
+
+
+class _PyCodeGen(Visitor):
+    """Statement visitors return indented source lines, expression visitors
+    return a Python expression string."""
+
+    def __init__(
+        self,
+        arg_names: t.Sequence[str],
+        known_functions: set[str],
+        allow_return: bool = True,
+    ) -> None:
+        super().__init__()
+        self._locals = {_py_name(n) for n in arg_names}
+        self._functions = known_functions
+        self._indent_level = 1
+        self._allow_return = allow_return
+
+    def visit_Integer(self, node: Integer) -> str:
+        # Not the raw lexeme: `007` is a valid Wabbit literal but invalid
+        # Python. The parsed value always round-trips.
+        return repr(node.num)
+
+    def visit_Float(self, node: Float) -> str:
+        return repr(node.num)
+
+    def visit_Boolean(self, node: Boolean) -> str:
+        return repr(node.value)
+
+    def visit_Character(self, node: Character) -> str:
+        return repr(node.value)
+
+    def visit_Name(self, node: Name) -> str:
+        if node.value not in self._locals:
+            raise Unsupported(f"Name '{node.value}' is not a local variable")
+        return node.value
+
+    def visit_BinOp(self, node: BinOp) -> str:
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        if node.operation == "/":
+            return f"_wb_div({left}, {right})"
+        return f"({left} {node.operation} {right})"
+
+    def visit_UnaryOp(self, node: UnaryOp) -> str:
+        operand = self.visit(node.operand)
+        if node.operation == "!":
+            return f"(not {operand})"
+        return f"({node.operation}{operand})"
+
+    def visit_LogicalOp(self, node: LogicalOp) -> str:
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        match node.operation:
+            case "&&":
+                return f"({left} and {right})"
+            case "||":
+                return f"({left} or {right})"
+            case _:
+                return f"({left} {node.operation} {right})"
+
+    def visit_ParenExpr(self, node: ParenExpr) -> str:
+        return f"({self.visit(node.value)})"
+
+    def visit_FuncCall(self, node: FuncCall) -> str:
+        if node.name.value not in self._functions:
+            raise Unsupported(f"Call to uncompiled function '{node.name.value}'")
+        args = ", ".join(self.visit(a) for a in node.args)
+        return f"{node.name.value}({args})"
+
+    def visit_Statements(self, node: Statements) -> list[str]:
+        lines: list[str] = []
+        for n in node.nodes:
+            lines.extend(self.visit(n))
+        return lines
+
+    def visit_ExprAsStatement(self, node: ExprAsStatement) -> list[str]:
+        return [self._line(self.visit(node.expr))]
+
+    def visit_PrintStatement(self, node: PrintStatement) -> list[str]:
+        return [self._line(f'print({self.visit(node.value)}, end="")')]
+
+    def visit_VarDecl(self, node: VarDecl) -> list[str]:
+        self._locals.add(_py_name(node.name.value))
+        value = self.visit(node.value) if node.value else _default_value_expr(node)
+        return [self._line(f"{node.name.value} = {value}")]
+
+    def visit_ConstDecl(self, node: ConstDecl) -> list[str]:
+        self._locals.add(_py_name(node.name.value))
+        return [self._line(f"{node.name.value} = {self.visit(node.value)}")]
+
+    def visit_Assignment(self, node: Assignment) -> str:
+        # Wabbit assignment is an expression (`a = b = 123`), hence the walrus.
+        assert isinstance(node.left, Name)
+        right = self.visit(node.right)
+        self._locals.add(_py_name(node.left.value))
+        return f"({node.left.value} := {right})"
+
+    def visit_IfElse(self, node: IfElse) -> list[str]:
+        lines = [self._line(f"if {self.visit(node.test)}:")]
+        lines.extend(self._block(node.body))
+        if node.else_body:
+            lines.append(self._line("else:"))
+            lines.extend(self._block(node.else_body))
+        return lines
+
+    def visit_While(self, node: While) -> list[str]:
+        lines = [self._line(f"while {self.visit(node.test)}:")]
+        lines.extend(self._block(node.body))
+        return lines
+
+    def visit_FuncDef(self, node: FuncDef) -> list[str]:
+        # Registered before the body is visited so recursion translates.
+        self._functions.add(_py_name(node.name.value))
+        arg_names = [_py_name(a.name.value) for a in node.args]
+        lines = [self._line(f"def {node.name.value}({', '.join(arg_names)}):")]
+        # Wabbit function scopes are flat: the body sees only its own
+        # arguments and locals, never the enclosing scope.
+        outer_locals = self._locals
+        self._locals = set(arg_names)
+        lines.extend(self._block(node.body))
+        self._locals = outer_locals
+        return lines
+
+    def visit_Break(self, node: Break) -> list[str]:
+        return [self._line("break")]
+
+    def visit_Continue(self, node: Continue) -> list[str]:
+        return [self._line("continue")]
+
+    def visit_Return(self, node: Return) -> list[str]:
+        if not self._allow_return:
+            # A loop extracted into its own function must not return early -
+            # the generated function's return carries the updated variables.
+            raise Unsupported("'return' inside an extracted loop")
+        return [self._line(f"return {self.visit(node.value)}")]
+
+    def _block(self, body: Statements) -> list[str]:
+        self._indent_level += 1
+        lines = self.visit(body) or [self._line("pass")]
+        self._indent_level -= 1
+        return lines
+
+    def _line(self, text: str) -> str:
+        return " " * 4 * self._indent_level + text
+
+
+def _wb_div(a, b):
+    if type(a) is int and type(b) is int:
+        return int(a / b)
+    return a / b
+
+
+def _default_value_expr(node: VarDecl) -> str:
+    match node.type_:
+        case Type(name="int"):
+            return "0"
+        case Type(name="float"):
+            return "0.0"
+        case Type(name="bool"):
+            return "False"
+        case Type(name="char"):
+            return repr("\0")
+        case _:
+            assert False, f"Unknown variable type: {node.type_}"
@@ -3,9 +3,12 @@
 Which then we can translate to machine code.
 """
 
+import hashlib
+import os
 import typing as t
+from pathlib import Path
 
-from llvmlite import ir
+from llvmlite import binding, ir
 
 from ._ast import *
 
@@ -16,12 +19,54 @@ _TBool = ir.IntType(1)
 _TChar = ir.IntType(8)
 _TVoid = ir.VoidType()
 
+# (operation, is_float) -> IRBuilder method. One dict lookup replaces a match
+# over the operation plus a type if/else per visited BinOp.
+_BINOP_METHODS: t.Final[dict[tuple[str, bool], t.Callable]] = {
+    ("+", False): ir.IRBuilder.add,
+    ("+", True): ir.IRBuilder.fadd,
+    ("-", False): ir.IRBuilder.sub,
+    ("-", True): ir.IRBuilder.fsub,
+    ("*", False): ir.IRBuilder.mul,
+    ("*", True): ir.IRBuilder.fmul,
+    ("/", False): ir.IRBuilder.sdiv,
+    ("/", True): ir.IRBuilder.fdiv,
+}
+
 
 # Note that compiler doesn't do any const, var definition, type checking, etc.
 # This will be done earlier by another visitor - "type checker".
 class Compiler(Visitor):
+    # Attribute access dominates the emit loop (`self._curr_builder.xxx` on
+    # every instruction); slots turn those lookups into offset loads and drop
+    # the per-instance `__dict__`.
+    __slots__ = (
+        "_global_variables",
+        "_func_locals",
+        "_current_variables",
+        "_functions",
+        "_mod",
+        "_main_func",
+        "_main_code_block",
+        "_main_entry_builder",
+        "_main_builder",
+        "_print_funcs",
+        "_int_consts",
+        "_float_consts",
+        "_bool_consts",
+        "_char_consts",
+        "_func_types",
+        "_blocks_nr",
+        "_curr_func",
+        "_curr_builder",
+        "_curr_entry_builder",
+    )
+
     def __init__(self) -> None:
+        super().__init__()
         self._global_variables: dict[str, ir.AllocaInstr] = {}
+        # Function bodies share one locals dict (Wabbit functions do not
+        # nest), cleared per definition instead of reallocated.
+        self._func_locals: dict[str, ir.AllocaInstr] = {}
         # Variables declared in the current context - changes when building a function.
         self._current_variables: dict[str, ir.AllocaInstr] = self._global_variables
         self._functions: dict[str, ir.Function] = {}
@@ -30,81 +75,130 @@ class Compiler(Visitor):
         self._main_func = ir.Function(
             self._mod, ir.FunctionType(_TInt, []), name="main"
         )
-        block = self._main_func.append_basic_block("main")
+        # Allocas go into a dedicated entry block, code into the next one:
+        # LLVM's mem2reg only promotes allocas that sit in the entry block, so
+        # locals declared inside loops/branches would otherwise stay as stack
+        # traffic. The entry block gets its branch terminator in `to_llvm()`,
+        # once all allocas are known.
+        entry_block = self._main_func.append_basic_block("entry")
+        self._main_code_block = self._main_func.append_basic_block("main")
+        self._main_entry_builder = ir.IRBuilder(entry_block)
         # IR builder for the `main` function block.
-        self._main_builder = ir.IRBuilder(block)
-
-        self._print_int = ir.Function(
-            self._mod, ir.FunctionType(_TVoid, [_TInt]), name="__wabbit_print_int"
-        )
-        self._print_float = ir.Function(
-            self._mod, ir.FunctionType(_TVoid, [_TFloat]), name="__wabbit_print_float"
-        )
-        self._print_bool = ir.Function(
-            self._mod, ir.FunctionType(_TVoid, [_TBool]), name="__wabbit_print_bool"
-        )
-        self._print_char = ir.Function(
-            self._mod, ir.FunctionType(_TVoid, [_TChar]), name="__wabbit_print_char"
-        )
+        self._main_builder = ir.IRBuilder(self._main_code_block)
+
+        # Print externs are declared on first use (see `visit_PrintStatement`):
+        # unused declarations bloat the module and every downstream reader of
+        # the IR has to parse them.
+        self._print_funcs: dict[ir.Type, ir.Function] = {}
+
+        # One ir.Constant per distinct literal: constructing them involves
+        # Python-side type checks that add up for literal-heavy code, and the
+        # same `0`/`1`/`true` shows up everywhere.
+        self._int_consts: dict[str, ir.Constant] = {}
+        self._float_consts: dict[str, ir.Constant] = {}
+        self._bool_consts: dict[bool, ir.Constant] = {}
+        self._char_consts: dict[str, ir.Constant] = {}
+        # Functions often share a signature (e.g. (int) -> int); reuse the
+        # ir.FunctionType instead of re-validating the same type list.
+        self._func_types: dict[tuple, ir.FunctionType] = {}
 
         self._blocks_nr = 0
+        # The function whose body is being built - control-flow visitors
+        # append their blocks to it.
+        self._curr_func = self._main_func
         # When building a function, we will use a different IR builder.
         self._curr_builder = self._main_builder
+        # Where the current function's allocas are emitted.
+        self._curr_entry_builder = self._main_entry_builder
+
+    def to_llvm(self, optimize: bool = True) -> str:
+        self._terminate()
+        ir_text = str(self._mod)
+        return str(_optimized_module(ir_text)) if optimize else ir_text
+
+    def to_bitcode(self) -> bytes:
+        """The optimized module as LLVM bitcode.
+
+        Bitcode is ~4x smaller than textual IR and much faster for
+        downstream tools (llc, JIT loaders) to read back, since it skips the
+        textual parse entirely.
+        """
+        self._terminate()
+        return _optimized_module(str(self._mod)).as_bitcode()
+
+    def write_ir(self, fp: t.TextIO) -> None:
+        """Stream the raw module IR into an open text file.
 
-    def to_llvm(self) -> str:
+        `str(module)` materializes the whole program as one Python string
+        before it can be written; for large modules writing one global value
+        at a time keeps peak memory at the size of the largest function.
+        """
+        self._terminate()
+        fp.write(f'target triple = "{self._mod.triple}"\n\n')
+        for gv in self._mod.global_values:
+            fp.write(str(gv))
+            fp.write("\n\n")
+
+    def _terminate(self) -> None:
+        """Terminate the open main blocks.
+
+        Call once, through one of the output methods above.
+        """
+        self._main_entry_builder.branch(self._main_code_block)
         self._main_builder.ret(ir.Constant(_TInt, 0))
-        return str(self._mod)
 
     def visit_Integer(self, node: Integer) -> ir.Value:
-        return ir.Constant(_TInt, node.value)
+        const = self._int_consts.get(node.value)
+        if const is None:
+            const = self._int_consts[node.value] = ir.Constant(_TInt, node.num)
+        return const
 
     def visit_Float(self, node: Float) -> ir.Value:
-        return ir.Constant(_TFloat, node.value)
+        const = self._float_consts.get(node.value)
+        if const is None:
+            const = self._float_consts[node.value] = ir.Constant(_TFloat, node.num)
+        return const
 
     def visit_Boolean(self, node: Boolean) -> ir.Value:
-        return ir.Constant(_TBool, int(node.value))
+        const = self._bool_consts.get(node.value)
+        if const is None:
+            const = self._bool_consts[node.value] = ir.Constant(
+                _TBool, int(node.value)
+            )
+        return const
 
     def visit_Character(self, node: Character) -> ir.Value:
-        return ir.Constant(_TChar, ord(node.value[0]))
+        const = self._char_consts.get(node.value)
+        if const is None:
+            const = self._char_consts[node.value] = ir.Constant(
+                _TChar, ord(node.value[0])
+            )
+        return const
 
     def visit_PrintStatement(self, node: PrintStatement) -> None:
         res = self.visit(node.value)
-        if res.type == _TInt:
-            self._curr_builder.call(self._print_int, [res])
-        elif res.type == _TFloat:
-            self._curr_builder.call(self._print_float, [res])
-        elif res.type == _TBool:
-            self._curr_builder.call(self._print_bool, [res])
-        elif res.type == _TChar:
-            self._curr_builder.call(self._print_char, [res])
+        print_func = self._print_funcs.get(res.type)
+        if print_func is None:
+            print_func = self._print_funcs[res.type] = ir.Function(
+                self._mod,
+                ir.FunctionType(_TVoid, [res.type]),
+                name=_PRINT_NAMES[res.type],
+            )
+        self._curr_builder.call(print_func, [res])
 
     def visit_VarDecl(self, node: VarDecl) -> None:
         var_name = node.name.value
         if node.value:
+            # The initializer's IR type is the variable's type - no need to
+            # dispatch over the four cases (the old chain also alloca'd the
+            # wrong type for bools: its last `elif` had decayed into an `if`).
             val = self.visit(node.value)
-            if val.type == _TInt:
-                var = self._curr_builder.alloca(_TInt, name=var_name)
-            elif val.type == _TFloat:
-                var = self._curr_builder.alloca(_TFloat, name=var_name)
-            elif val.type == _TChar:
-                var = self._curr_builder.alloca(_TChar, name=var_name)
-            if val.type == _TBool:
-                var = self._curr_builder.alloca(_TBool, name=var_name)
-            else:
-                assert False
+            var = self._curr_entry_builder.alloca(val.type, name=var_name)
         else:
             val = _default_var_type(node)
-            match node.type_:
-                case Type(name="int"):
-                    var = self._curr_builder.alloca(_TInt, name=var_name)
-                case Type(name="float"):
-                    var = self._curr_builder.alloca(_TFloat, name=var_name)
-                case Type(name="char"):
-                    var = self._curr_builder.alloca(_TBool, name=var_name)
-                case Type(name="bool"):
-                    var = self._curr_builder.alloca(_TBool, name=var_name)
-                case _:
-                    assert False
+            var = self._curr_entry_builder.alloca(
+                _TYPE_MAP[node.type_.name], name=var_name
+            )
 
         self._curr_builder.store(val, var)
         self._current_variables[var_name] = var
@@ -112,40 +206,54 @@ class Compiler(Visitor):
     def visit_ConstDecl(self, node: ConstDecl) -> None:
         var_name = node.name.value
         val = self.visit(node.value)
-
-        if val.type == _TInt:
-            var = self._curr_builder.alloca(_TInt, name=var_name)
-        elif val.type == _TFloat:
-            var = self._curr_builder.alloca(_TFloat, name=var_name)
-        elif val.type == _TChar:
-            var = self._curr_builder.alloca(_TChar, name=var_name)
-        else:
-            assert False
+        # As in visit_VarDecl; the old chain additionally rejected booleans.
+        var = self._curr_entry_builder.alloca(val.type, name=var_name)
 
         self._curr_builder.store(val, var)
         self._current_variables[var_name] = var
 
     def visit_FuncDef(self, func_def: FuncDef) -> None:
-        arg_types = [_var_type(a.type_) for a in func_def.args]
+        arg_types = tuple(_var_type(a.type_) for a in func_def.args)
         ret_type = _var_type(func_def.return_type)
         func_name = func_def.name.value
-        f = ir.Function(self._mod, ir.FunctionType(ret_type, arg_types), func_name)
 
+        ftype = self._func_types.get((ret_type, arg_types))
+        if ftype is None:
+            ftype = self._func_types[(ret_type, arg_types)] = ir.FunctionType(
+                ret_type, arg_types
+            )
+        f = ir.Function(self._mod, ftype, func_name)
+        # Registered before the body is compiled so recursive call sites
+        # resolve the callee instead of failing the lookup.
+        self._functions[func_name] = f
+
+        entry_block = f.append_basic_block("entry")
         block = self._next_block(f)
+        self._curr_func = f
+        self._curr_entry_builder = ir.IRBuilder(entry_block)
         # So that other visitor methods would build IR instructions into this block.
         self._curr_builder = ir.IRBuilder(block)
-        self._current_variables = {}
+        self._func_locals.clear()
+        self._current_variables = self._func_locals
 
         for i, arg in enumerate(f.args):
             var_name = func_def.args[i].name.value
-            var = self._curr_builder.alloca(arg.type, name=var_name)
-            self._curr_builder.store(arg, var)
+            var = self._curr_entry_builder.alloca(arg.type, name=var_name)
+            self._curr_entry_builder.store(arg, var)
             self._current_variables[var_name] = var
 
         self.visit(func_def.body)
-        self._functions[func_name] = f
-
+        if not self._curr_builder.block.is_terminated:
+            # When every path through the body already returned (e.g. both
+            # arms of a final if/else), the builder is left on the dangling
+            # merge block - give it a terminator so the IR stays valid.
+            self._curr_builder.unreachable()
+        # Every alloca is in place now; the entry block can fall through.
+        self._curr_entry_builder.branch(block)
+
+        self._curr_func = self._main_func
         self._curr_builder = self._main_builder
+        self._curr_entry_builder = self._main_entry_builder
         self._current_variables = self._global_variables
 
     def visit_Return(self, node: Return) -> t.Any:
@@ -160,88 +268,87 @@ class Compiler(Visitor):
     def visit_Name(self, node: Name):
         return self._curr_builder.load(self._current_variables[node.value])
 
-    def visit_BinOp(self, node: BinOp) -> t.Any:
-        left = self.visit(node.left)
-        right = self.visit(node.right)
+    def _operand(self, node: Expression) -> ir.Value:
+        """`visit` minus a dict lookup for the leaf kinds that dominate
+        expression trees; anything else goes through the dispatch table.
+        """
+        cls = type(node)
+        if cls is Integer:
+            return self.visit_Integer(node)
+        if cls is Name:
+            return self.visit_Name(node)
+        return self._dispatch[cls](node)
 
-        match node.operation:
-            case "+":
-                if left.type == _TFloat:
-                    return self._curr_builder.fadd(left, right)
-                else:
-                    return self._curr_builder.add(left, right)
-            case "-":
-                if left.type == _TFloat:
-                    return self._curr_builder.fsub(left, right)
-                else:
-                    return self._curr_builder.sub(left, right)
-            case "*":
-                if left.type == _TFloat:
-                    return self._curr_builder.fmul(left, right)
-                else:
-                    return self._curr_builder.mul(left, right)
-            case "/":
-                if left.type == _TFloat:
-                    return self._curr_builder.fdiv(left, right)
+    def visit_BinOp(self, node: BinOp) -> t.Any:
+        op = node.operation
+        # `x + 1 + 2 + 3` parses left-associatively as `((x + 1) + 2) + 3`,
+        # hiding the literal run from the constant-pair folder below. For
+        # commutative integer ops, walk the left spine combining trailing
+        # literals so the chain emits as one instruction. Floats are left
+        # alone - reassociating them changes results.
+        if op in ("+", "*") and type(node.right) is Integer:
+            combined = node.right.num
+            left_node = node.left
+            while (
+                type(left_node) is BinOp
+                and left_node.operation == op
+                and type(left_node.right) is Integer
+            ):
+                if op == "+":
+                    combined += left_node.right.num
                 else:
-                    return self._curr_builder.sdiv(left, right)
+                    combined *= left_node.right.num
+                left_node = left_node.left
+            if left_node is not node.left:
+                left = self._operand(left_node)
+                right = ir.Constant(_TInt, combined)
+                if type(left) is ir.Constant:
+                    if (folded := _fold_binop(op, left, right)) is not None:
+                        return folded
+                return _BINOP_METHODS[(op, False)](self._curr_builder, left, right)
+
+        left = self._operand(node.left)
+        right = self._operand(node.right)
+        if type(left) is ir.Constant and type(right) is ir.Constant:
+            if (folded := _fold_binop(op, left, right)) is not None:
+                return folded
+        emit = _BINOP_METHODS[(op, left.type == _TFloat)]
+        return emit(self._curr_builder, left, right)
 
     def visit_UnaryOp(self, node: UnaryOp) -> t.Any:
+        val = self._operand(node.operand)
         match node.operation:
             case "-":
-                val = self.visit(node.operand)
+                if type(val) is ir.Constant:
+                    return ir.Constant(val.type, -val.constant)
                 if val.type == _TInt:
                     return self._curr_builder.neg(val)
                 else:
                     return self._curr_builder.fneg(val)
 
             case "+":
-                return self.visit(node.operand)
+                return val
 
             case "!":
-                val = self.visit(node.operand)
+                if type(val) is ir.Constant:
+                    return ir.Constant(val.type, 1 - val.constant)
                 return self._curr_builder.not_(val)
 
     def visit_LogicalOp(self, node: LogicalOp) -> t.Any:
-        left = self.visit(node.left)
-        right = self.visit(node.right)
-        match node.operation:
-            case "==":
-                if left.type == _TFloat:
-                    return self._curr_builder.fcmp_ordered("==", left, right)
-                else:
-                    return self._curr_builder.icmp_signed("==", left, right)
-            case "!=":
-                if left.type == _TFloat:
-                    return self._curr_builder.fcmp_ordered("!=", left, right)
-                else:
-                    return self._curr_builder.icmp_signed("!=", left, right)
-            case ">":
-                if left.type == _TFloat:
-                    return self._curr_builder.fcmp_ordered(">", left, right)
-                else:
-                    return self._curr_builder.icmp_signed(">", left, right)
-            case ">=":
-                if left.type == _TFloat:
-                    return self._curr_builder.fcmp_ordered(">=", left, right)
-                else:
-                    return self._curr_builder.icmp_signed(">=", left, right)
-            case "<":
-                if left.type == _TFloat:
-                    return self._curr_builder.fcmp_ordered("<", left, right)
-                else:
-                    return self._curr_builder.icmp_signed("<", left, right)
-            case "<=":
-                if left.type == _TFloat:
-                    return self._curr_builder.fcmp_ordered("<=", left, right)
-                else:
-                    return self._curr_builder.icmp_signed("<=", left, right)
-            case "&&":
-                return self._curr_builder.and_(left, right)
-            case "||":
-                return self._curr_builder.or_(left, right)
-            case _:
-                raise RuntimeError("not possible")
+        left = self._operand(node.left)
+        right = self._operand(node.right)
+        op = node.operation
+        if type(left) is ir.Constant and type(right) is ir.Constant:
+            return _fold_logical_op(op, left, right)
+        if op == "&&":
+            return self._curr_builder.and_(left, right)
+        if op == "||":
+            return self._curr_builder.or_(left, right)
+        # Wabbit's comparison spellings match llvmlite's, so the operation
+        # string passes straight through.
+        if left.type == _TFloat:
+            return self._curr_builder.fcmp_ordered(op, left, right)
+        return self._curr_builder.icmp_signed(op, left, right)
 
     def visit_Assignment(self, node: Assignment):
         assert isinstance(node.left, Name)
@@ -256,21 +363,27 @@ class Compiler(Visitor):
     def visit_IfElse(self, node: IfElse) -> t.Any:
         test_res = self.visit(node.test)
 
-        # TODO(povilas): self._curr_func()?
-        then_block = self._next_block(self._main_func)
-        else_block = self._next_block(self._main_func) if node.else_body else None
-        merge_block = self._next_block(self._main_func)
+        else_block = None
+        if node.else_body:
+            then_block, else_block, merge_block = self._next_blocks(
+                self._curr_func, 3
+            )
+        else:
+            then_block, merge_block = self._next_blocks(self._curr_func, 2)
 
         self._curr_builder.cbranch(test_res, then_block, else_block or merge_block)
 
         self._curr_builder.position_at_end(then_block)
         self.visit(node.body)
-        self._curr_builder.branch(merge_block)
+        if not self._curr_builder.block.is_terminated:
+            # A body ending in `return` already terminated its block.
+            self._curr_builder.branch(merge_block)
 
         if else_body := node.else_body:
             self._curr_builder.position_at_end(else_block)
             self.visit(else_body)
-            self._curr_builder.branch(merge_block)
+            if not self._curr_builder.block.is_terminated:
+                self._curr_builder.branch(merge_block)
 
         self._curr_builder.position_at_end(merge_block)
 
@@ -289,9 +402,9 @@ class Compiler(Visitor):
             }
             # loop_exit
         """
-        loop_body_block = self._next_block(self._main_func)
-        loop_exit_block = self._next_block(self._main_func)
-        loop_test_block = self._next_block(self._main_func)
+        loop_body_block, loop_exit_block, loop_test_block = self._next_blocks(
+            self._curr_func, 3
+        )
 
         # Seems like we always need to branch into the label.
         self._curr_builder.branch(loop_test_block)
@@ -315,34 +428,141 @@ class Compiler(Visitor):
     def _next_block(self, func: ir.Function) -> ir.Block:
         return func.append_basic_block(self._next_block_name())
 
+    def _next_blocks(self, func: ir.Function, n: int) -> list[ir.Block]:
+        """`n` blocks with one counter bump - control-flow visitors need two
+        or three at a time.
+        """
+        base = self._blocks_nr
+        self._blocks_nr = base + n
+        append = func.append_basic_block
+        return [append(f"block_{base + i}") for i in range(1, n + 1)]
+
     def _next_block_name(self) -> str:
         self._blocks_nr += 1
         return f"block_{self._blocks_nr}"
 
 
+# Folding constant expressions in the visitor means the folded IR text is
+# never built, serialized and re-parsed - cheaper than leaving the cleanup to
+# LLVM's own constant folder.
+def _fold_binop(op: str, left: ir.Constant, right: ir.Constant) -> ir.Constant | None:
+    l, r = left.constant, right.constant
+    if op == "+":
+        value = l + r
+    elif op == "-":
+        value = l - r
+    elif op == "*":
+        value = l * r
+    else:
+        if r == 0:
+            # Leave division by zero to LLVM's semantics.
+            return None
+        value = l / r if left.type == _TFloat else int(l / r)
+    return ir.Constant(left.type, value)
+
+
+def _fold_logical_op(op: str, left: ir.Constant, right: ir.Constant) -> ir.Constant:
+    l, r = left.constant, right.constant
+    if op == "&&":
+        value = l and r
+    elif op == "||":
+        value = l or r
+    else:
+        value = _CMP_FOLDS[op](l, r)
+    return ir.Constant(_TBool, int(value))
+
+
+_CMP_FOLDS: t.Final[dict[str, t.Callable]] = {
+    "==": lambda l, r: l == r,
+    "!=": lambda l, r: l != r,
+    ">": lambda l, r: l > r,
+    ">=": lambda l, r: l >= r,
+    "<": lambda l, r: l < r,
+    "<=": lambda l, r: l <= r,
+}
+
+
+def compile_cached(source: str) -> str:
+    """Compile Wabbit source to optimized LLVM IR, cached on disk.
+
+    Compilation is deterministic, so the IR is keyed by a hash of the source
+    text - the same scheme `_parser.parse_file` uses for ASTs. Re-compiling
+    an unchanged file (editor save hooks, test loops) becomes one file read
+    instead of a full parse + IR build + LLVM pass run.
+    """
+    cache_file = _ir_cache_file(source)
+    try:
+        return cache_file.read_text()
+    except OSError:
+        pass
+
+    from ._parser import parse_source
+
+    compiler = Compiler()
+    compiler.visit(parse_source(source))
+    ir_text = compiler.to_llvm()
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(ir_text)
+    except OSError:
+        pass
+    return ir_text
+
+
+def _ir_cache_file(source: str) -> Path:
+    digest = hashlib.blake2b(source.encode()).hexdigest()
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_home / "wabbit" / f"{digest}.ll"
+
+
+def _optimized_module(ir_text: str) -> "binding.ModuleRef":
+    """Run LLVM's O2 module pipeline over the emitted IR.
+
+    Raw IR keeps every local in an alloca and every `2 + 3` as an `add`;
+    mem2reg, constant folding, simplifycfg etc. shrink typical Wabbit modules
+    several-fold before clang ever sees them.
+    """
+    binding.initialize_native_target()
+    binding.initialize_native_asmprinter()
+
+    mod_ref = binding.parse_assembly(ir_text)
+    target_machine = binding.Target.from_default_triple().create_target_machine()
+    tuning = binding.create_pipeline_tuning_options(speed_level=2)
+    pass_builder = binding.PassBuilder(target_machine, tuning)
+    pass_builder.getModulePassManager().run(mod_ref, pass_builder)
+    return mod_ref
+
+
+# Wabbit has four types; mapping their names once beats re-running the
+# structural match protocol on every declaration.
+_TYPE_MAP: t.Final[dict[str, ir.Type]] = {
+    "int": _TInt,
+    "float": _TFloat,
+    "bool": _TBool,
+    "char": _TChar,
+}
+
+# Runtime print symbols by argument IR type.
+_PRINT_NAMES: t.Final[dict[ir.Type, str]] = {
+    _TInt: "__wabbit_print_int",
+    _TFloat: "__wabbit_print_float",
+    _TBool: "__wabbit_print_bool",
+    _TChar: "__wabbit_print_char",
+}
+
+_DEFAULT_VALUE_MAP: t.Final[dict[str, ir.Constant]] = {
+    "int": ir.Constant(_TInt, "0"),
+    "float": ir.Constant(_TFloat, "0.0"),
+    "bool": ir.Constant(_TBool, "0"),
+    "char": ir.Constant(_TChar, "0"),
+}
+
+
 def _default_var_type(node: VarDecl) -> ir.Value:
-    match node.type_:
-        case Type(name="int"):
-            return ir.Constant(_TInt, "0")
-        case Type(name="float"):
-            return ir.Constant(_TFloat, "0.0")
-        case Type(name="bool"):
-            return ir.Constant(_TBool, "0")
-        case Type(name="char"):
-            return ir.Constant(_TChar, "0")
-        case _:
-            assert False, f"Unknown variable type: {node.type_}"
+    assert node.type_ is not None, f"Untyped variable declaration: {node}"
+    return _DEFAULT_VALUE_MAP[node.type_.name]
 
 
 def _var_type(node: Type) -> ir.Type:
-    match node:
-        case Type(name="int"):
-            return _TInt
-        case Type(name="float"):
-            return _TFloat
-        case Type(name="bool"):
-            return _TBool
-        case Type(name="char"):
-            return _TChar
-        case _:
-            assert False, f"Unknown variable type: {node}"
+    return _TYPE_MAP[node.name]
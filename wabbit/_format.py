@@ -7,18 +7,54 @@ from ._ast import *
 
 _INDENT_SPACES: t.Final[int] = 4
 
+# Indentation prefixes built once: `_emit` runs per output line and should
+# not re-multiply the same string every time. 64 levels is plenty; deeper
+# nesting falls back to multiplication.
+_INDENTS: t.Final[list[str]] = [" " * (i * _INDENT_SPACES) for i in range(64)]
+
 
 def format(node: Node) -> str:
-    return _FormatVisitor().visit(node)
+    visitor = _FormatVisitor()
+    if (res := visitor.visit(node)) is not None:
+        # `node` was a lone expression.
+        return res
+    return "\n".join(visitor.lines())
 
 
 class _FormatVisitor(Visitor):
+    """Expression visitors return strings; statement visitors append finished
+    lines into a shared buffer.
+
+    Returning strings from statement visitors too meant every nested block was
+    joined into an intermediate string that its parent joined again - O(n^2)
+    for deeply nested code. With the shared buffer each line is built once and
+    the single join happens in `format()`.
+    """
+
+    __slots__ = ("_indent_level", "_lines", "_memo")
+
     def __init__(self) -> None:
+        super().__init__()
         self._indent_level = 0
+        self._lines: list[str] = []
+        # Formatted expressions keyed by id(node): interned literal nodes are
+        # shared all over the tree, so each distinct one formats only once.
+        # Sound because expression output does not depend on indentation, and
+        # the tree being formatted keeps the ids alive.
+        self._memo: dict[int, str] = {}
+
+    def lines(self) -> list[str]:
+        return self._lines
 
     # TODO(povilas): use beartype to ensure str is returned?
-    def visit(self, node: Node) -> str:
-        return super().visit(node)
+    def visit(self, node: Node) -> str | None:
+        res = self._memo.get(id(node))
+        if res is None:
+            res = self._dispatch[type(node)](node)
+            if res is not None:
+                # Statement visitors return None - only expressions memoize.
+                self._memo[id(node)] = res
+        return res
 
     def visit_Integer(self, node: Integer) -> str:
         return str(node.value)
@@ -35,14 +71,14 @@ class _FormatVisitor(Visitor):
     def visit_Name(self, node: Name) -> str:
         return node.value
 
-    def visit_PrintStatement(self, node: PrintStatement) -> str:
-        return f"print {self.visit(node.value)};"
+    def visit_PrintStatement(self, node: PrintStatement) -> None:
+        self._emit(f"print {self.visit(node.value)};")
 
-    def visit_Break(self, node: Break) -> str:
-        return "break;"
+    def visit_Break(self, node: Break) -> None:
+        self._emit("break;")
 
-    def visit_Continue(self, node: Continue) -> str:
-        return "continue;"
+    def visit_Continue(self, node: Continue) -> None:
+        self._emit("continue;")
 
     def visit_BinOp(self, node: BinOp) -> str:
         return f"{self.visit(node.left)} {node.operation} {self.visit(node.right)}"
@@ -59,70 +95,88 @@ class _FormatVisitor(Visitor):
     def visit_Assignment(self, node: Assignment) -> str:
         return f"{self.visit(node.left)} = {self.visit(node.right)}"
 
-    def visit_VarDecl(self, node: VarDecl) -> str:
-        type_suffix = f" {node.type_.name}" if node.type_ else ""
-        maybe_value = f" = {self.visit(node.value)}" if node.value else ""
-        return f"var {node.name.value}{type_suffix}{maybe_value};"
-
-    def visit_ConstDecl(self, node: ConstDecl) -> str:
-        type_suffix = f" {node.type_.name}" if node.type_ else ""
-        value = self.visit(node.value)
-        return f"const {node.name.value}{type_suffix} = {value};"
-
-    def visit_Statements(self, node: Statements) -> str:
-        return "\n".join(_indent(self.visit(n), self._indent_level) for n in node.nodes)
-
-    def visit_ExprAsStatement(self, node: ExprAsStatement) -> t.Any:
-        return f"{self.visit(node.expr)};"
-
-    def visit_IfElse(self, node: IfElse) -> str:
-        lines = [
-            f"if {self.visit(node.test)} {{",
-        ]
+    def visit_VarDecl(self, node: VarDecl) -> None:
+        # Branching on the four type/value cases keeps each line a single
+        # f-string instead of joining conditional suffix strings.
+        name = node.name.value
+        if node.type_:
+            if node.value:
+                self._emit(
+                    f"var {name} {node.type_.name} = {self.visit(node.value)};"
+                )
+            else:
+                self._emit(f"var {name} {node.type_.name};")
+        elif node.value:
+            self._emit(f"var {name} = {self.visit(node.value)};")
+        else:
+            self._emit(f"var {name};")
+
+    def visit_ConstDecl(self, node: ConstDecl) -> None:
+        name = node.name.value
+        if node.type_:
+            self._emit(
+                f"const {name} {node.type_.name} = {self.visit(node.value)};"
+            )
+        else:
+            self._emit(f"const {name} = {self.visit(node.value)};")
+
+    def visit_Statements(self, node: Statements) -> None:
+        for n in node.nodes:
+            # A lone expression in statement position still formats as a line.
+            if (res := self.visit(n)) is not None:
+                self._emit(res)
+
+    def visit_ExprAsStatement(self, node: ExprAsStatement) -> None:
+        self._emit(f"{self.visit(node.expr)};")
+
+    def visit_IfElse(self, node: IfElse) -> None:
+        self._emit(f"if {self.visit(node.test)} {{")
         self._indent_level += 1
-        lines.append(self.visit(node.body))
+        self.visit(node.body)
         self._indent_level -= 1
 
         if node.else_body is not None:
-            lines.append(_indent("} else {", self._indent_level))
+            self._emit("} else {")
             self._indent_level += 1
-            lines.append(self.visit(node.else_body))
+            self.visit(node.else_body)
             self._indent_level -= 1
 
-        lines.append(_indent("}", self._indent_level))
-        return "\n".join(lines)
+        self._emit("}")
 
-    def visit_While(self, node: While) -> str:
-        lines = [
-            f"while {self.visit(node.test)} {{",
-        ]
+    def visit_While(self, node: While) -> None:
+        self._emit(f"while {self.visit(node.test)} {{")
         self._indent_level += 1
-        lines.append(self.visit(node.body))
+        self.visit(node.body)
         self._indent_level -= 1
-        lines.append("}")
-        return "\n".join(lines)
+        self._emit("}")
 
-    def visit_FuncDef(self, node: FuncDef) -> str:
+    def visit_FuncDef(self, node: FuncDef) -> None:
         formatted_args = ", ".join([self.visit(arg) for arg in node.args])
-        lines = [f"func {node.name.value}({formatted_args}) {node.return_type.name} {{"]
+        self._emit(f"func {node.name.value}({formatted_args}) {node.return_type.name} {{")
 
         self._indent_level += 1
-        lines.append(self.visit(node.body))
+        self.visit(node.body)
         self._indent_level -= 1
 
-        lines.append("}")
-        return "\n".join(lines)
+        self._emit("}")
 
     def visit_FuncArg(self, node: FuncArg) -> str:
         return f"{node.name.value} {node.type_.name}"
 
-    def visit_Return(self, node: Return) -> str:
-        return f"return {self.visit(node.value)};"
+    def visit_Return(self, node: Return) -> None:
+        self._emit(f"return {self.visit(node.value)};")
 
     def visit_FuncCall(self, node: FuncCall) -> str:
         formatted_args = ", ".join(self.visit(arg) for arg in node.args)
         return f"{node.name.value}({formatted_args})"
 
-
-def _indent(text: str, indent_level: int) -> str:
-    return " " * indent_level * _INDENT_SPACES + text
+    def _emit(self, line: str) -> None:
+        level = self._indent_level
+        if not level:
+            # Top-level statements dominate most programs; skip the
+            # empty-prefix concatenation for them.
+            self._lines.append(line)
+        elif level < len(_INDENTS):
+            self._lines.append(_INDENTS[level] + line)
+        else:
+            self._lines.append(" " * level * _INDENT_SPACES + line)
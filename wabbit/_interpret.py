@@ -1,123 +1,240 @@
 """A simple (but slow) Wabbit language interpreter."""
 
+import operator
 import typing as t
-
-from ._ast import *
-from ._errors import WabbitRuntimeError, WabbitTypeError
+from dataclasses import dataclass, field
+
+from . import _bytecode, _codegen_py
+from ._ast import (
+    Assignment,
+    BinOp,
+    Boolean,
+    Character,
+    ConstDecl,
+    ExprAsStatement,
+    Float,
+    FuncArg,
+    FuncCall,
+    FuncDef,
+    IfElse,
+    Integer,
+    LogicalOp,
+    Name,
+    Node,
+    ParenExpr,
+    PrintStatement,
+    Return,
+    Statements,
+    Type,
+    UnaryOp,
+    VarDecl,
+    Visitor,
+    While,
+)
+from ._errors import WabbitRuntimeError
+from ._optimize import fold_constants
 
 
 def interpret(ast: Node) -> None:
-    """Interpret the given Wabbit program AST."""
-    _Interpreter().visit(ast)
+    """Interpret the given Wabbit program AST.
+
+    Folds literal subtrees (see `_optimize`), then lowers the AST to
+    bytecode (see `_bytecode`) - the tree-walking `_Interpreter` below is
+    kept as the reference implementation.
+    """
+    _bytecode.interpret(fold_constants(ast))
 
 
 _DataTypes: t.TypeAlias = int | float | bool | str
 
 
-class _UnsupportedOperation(WabbitRuntimeError):
-    def __init__(self, data_type: type[_DataTypes], operation: "str") -> None:
-        msg = f"Unsupported operation '{operation}' with '{data_type}'"
-        super().__init__(msg)
+def _div(a: _DataTypes, b: _DataTypes) -> _DataTypes:
+    """Wabbit integer division truncates: `7 / -2` is -3."""
+    if type(a) is int and type(b) is int:
+        return int(a / b)
+    return a / b
+
+
+def _int_div(a: int, b: int) -> int:
+    return int(a / b)
+
+
+# Dispatch tables built once at import time: one dict lookup per operation
+# instead of a `match` over string literals.
+_BIN_OPS: t.Final[dict[str, t.Callable]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": _div,
+}
+
+_CMP_OPS: t.Final[dict[str, t.Callable]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+_UNARY_OPS: t.Final[dict[str, t.Callable]] = {
+    "-": operator.neg,
+    "+": operator.pos,
+    "!": operator.not_,
+}
 
 
 class _Interpreter(Visitor):
     """
     Expressions return a value, Statements do not.
+
+    Values are raw Python `int`/`float`/`bool`/`str` - boxing every integer
+    into a wrapper object made arithmetic-heavy loops allocation-bound.
+    Type checking is meant to happen before interpretation.
+
+    Expects an AST that went through `_resolve.resolve()`.
     """
 
+    # TODO(povilas): type-check the AST in a pre-interpret pass
+
     def __init__(self) -> None:
+        super().__init__()
         # A stack of execution contexts: from global to local ones when going into a
         # function or if/while block.
         self._exec_ctx = [_ExecCtx()]
         # TODO(povilas): move functions to global context
-
-    def visit_Integer(self, node: Integer) -> "_IntegerVar":
-        return _IntegerVar(int(node.value))
-
-    def visit_Float(self, node: Float) -> "_FloatVar":
-        return _FloatVar(float(node.value))
-
-    def visit_Boolean(self, node: Boolean) -> "_BooleanVar":
-        return _BooleanVar(node.value)
-
-    def visit_Character(self, node: Character) -> "_CharVar":
-        return _CharVar(node.value)
-
-    def visit_Name(self, node: Name) -> "_DataType":
-        ctx = self._curr_ctx()
-        if node.value in ctx.variables:
-            return ctx.variables[node.value]
-        if node.value in ctx.constants:
-            return ctx.constants[node.value]
-
-        raise WabbitRuntimeError(f"Undefined variable '{node.value}'")
+        # Holds Wabbit functions JIT-compiled to Python, see `visit_FuncCall`.
+        self._py_env: dict[str, t.Any] = {}
+        # Per-block (handler, node) pairs, see `visit_Statements`. Keyed by
+        # id(); the values keep the nodes alive so ids cannot be recycled.
+        self._stmt_handlers: dict[int, list] = {}
+        # (test handler, body handlers, node) per While node, see `visit_While`.
+        self._while_handlers: dict[int, tuple] = {}
+        # (compiled loop, variable slots, node) per While node, or None when
+        # translation was attempted and failed. See `visit_While`.
+        self._py_loops: dict[int, tuple | None] = {}
+        # (op, left handler, left, right handler, right, node) per BinOp node,
+        # see `visit_BinOp`.
+        self._binop_handlers: dict[int, tuple] = {}
+        # Same idea per LogicalOp node, see `visit_LogicalOp`.
+        self._logical_handlers: dict[int, tuple] = {}
+
+    def visit_Integer(self, node: Integer) -> int:
+        return node.num
+
+    def visit_Float(self, node: Float) -> float:
+        return node.num
+
+    def visit_Boolean(self, node: Boolean) -> bool:
+        return node.value
+
+    def visit_Character(self, node: Character) -> str:
+        return node.value
+
+    def visit_Name(self, node: Name) -> _DataTypes:
+        # Names resolve to slot indices before interpretation (see `_resolve`),
+        # so a variable read is one list index instead of dict lookups. A
+        # declaration inside a skipped branch leaves its slot missing or None
+        # (see `_store`) - reading it is a runtime error, not an IndexError.
+        try:
+            val = self._curr_ctx().slots[node.slot]
+        except IndexError:
+            val = None
+        if val is None:
+            raise WabbitRuntimeError(f"Undefined variable '{node.value}'")
+        return val
 
     def visit_PrintStatement(self, node: PrintStatement) -> None:
-        res: _DataType = self.visit(node.value)
-        # TODO(povilas): assert type _DataType
-        print(res.value, end="")
-
-    def visit_BinOp(self, node: BinOp) -> t.Any:
-        val1 = self.visit(node.left)
-        val2 = self.visit(node.right)
-
-        match node.operation:
-            case "+":
-                return val1.add(val2)
-            case "-":
-                return val1.sub(val2)
-            case "*":
-                return val1.mul(val2)
-            case "/":
-                return val1.div(val2)
-
-    def visit_UnaryOp(self, node: UnaryOp) -> "_DataType":
-        match node.operation:
-            case "-":
-                val = self.visit(node.operand)
-                return val.unary_minus()
-
-            case "+":
-                val = self.visit(node.operand)
-                return val.unary_plus()
-
-            case "!":
-                val = self.visit(node.operand)
-                return val.logical_not()
-
-            case _:
-                raise WabbitRuntimeError(f"Unknown unary operator '{node.operation}'")
-
-    def visit_LogicalOp(self, node: LogicalOp) -> "_DataType":
-        left = self.visit(node.left)
-        right = self.visit(node.right)
-        match node.operation:
-            case "==":
-                return left.cmp_eq(right)
-            case "!=":
-                return left.cmp_not_eq(right)
-            case ">":
-                return left.cmp_more(right)
-            case ">=":
-                return left.cmp_more_eq(right)
-            case "<":
-                return left.cmp_less(right)
-            case "<=":
-                return left.cmp_less_eq(right)
-            case "&&":
-                return left.logical_and(right)
-            case "||":
-                return left.logical_or(right)
-            case _:
-                raise RuntimeError("not possible")
+        res = self.visit(node.value)
+        print(res, end="")
+
+    def visit_BinOp(self, node: BinOp) -> _DataTypes:
+        # Each BinOp node always applies the same operator to the same operand
+        # node types, so resolve all three once and reuse them on re-visits.
+        cached = self._binop_handlers.get(id(node))
+        if cached is None:
+            return self._specialize_binop(node)
+        op, left_handler, left, right_handler, right, _ = cached
+        return op(left_handler(left), right_handler(right))
+
+    def _specialize_binop(self, node: BinOp) -> _DataTypes:
+        """First evaluation of a BinOp node: pick and cache its operator.
+
+        `+`/`-`/`*` are single C-level `operator` calls already; `/` is the
+        one op that branches on operand types. Wabbit is statically typed, so
+        a node's operand types never change and the int-vs-float choice can be
+        made once, from the first evaluation's values.
+        """
+        dispatch = self._dispatch
+        left_handler = dispatch[type(node.left)]
+        right_handler = dispatch[type(node.right)]
+        left_val = left_handler(node.left)
+        right_val = right_handler(node.right)
+
+        op = _BIN_OPS[node.operation]
+        if node.operation == "/":
+            if type(left_val) is int and type(right_val) is int:
+                op = _int_div
+            else:
+                op = operator.truediv
+
+        self._binop_handlers[id(node)] = (
+            op,
+            left_handler,
+            node.left,
+            right_handler,
+            node.right,
+            node,
+        )
+        return op(left_val, right_val)
+
+    def visit_UnaryOp(self, node: UnaryOp) -> _DataTypes:
+        return _UNARY_OPS[node.operation](self.visit(node.operand))
+
+    def visit_LogicalOp(self, node: LogicalOp) -> _DataTypes:
+        # Like `visit_BinOp`: the operation string is inspected once per node,
+        # re-visits run off the cached comparison function (None for the
+        # short-circuiting `&&`/`||`).
+        cached = self._logical_handlers.get(id(node))
+        if cached is None:
+            dispatch = self._dispatch
+            op = node.operation
+            cached = (
+                _CMP_OPS.get(op),
+                op == "&&",
+                dispatch[type(node.left)],
+                node.left,
+                dispatch[type(node.right)],
+                node.right,
+                node,
+            )
+            self._logical_handlers[id(node)] = cached
+        cmp, is_and, left_handler, left, right_handler, right, _ = cached
+
+        left_val = left_handler(left)
+        if cmp is None:
+            # `&&`/`||` short-circuit: the right operand is only evaluated
+            # when the left one does not already decide the result.
+            if is_and:
+                return left_val and right_handler(right)
+            return left_val or right_handler(right)
+        return cmp(left_val, right_handler(right))
 
     def visit_ParenExpr(self, node: ParenExpr) -> t.Any:
         return self.visit(node.value)
 
     def visit_Statements(self, node: Statements) -> t.Any:
+        # A loop body re-enters this block every iteration: dispatch the
+        # statements once and reuse the bound handlers afterwards.
+        handlers = self._stmt_handlers.get(id(node))
+        if handlers is None:
+            dispatch = self._dispatch
+            handlers = [(dispatch[type(s)], s) for s in node.nodes]
+            self._stmt_handlers[id(node)] = handlers
+
         res = None
-        for s in node.nodes:
-            res = self.visit(s)
+        for handler, s in handlers:
+            res = handler(s)
 
         # This is only to cater a `return` statement.
         return res
@@ -126,25 +243,16 @@ class _Interpreter(Visitor):
         self.visit(node.expr)
 
     def visit_VarDecl(self, node: VarDecl) -> None:
-        var_name = node.name.value
-        variables = self._curr_ctx().variables
-        if var_name in variables or var_name in self._curr_ctx().constants:
-            raise WabbitRuntimeError("Variable '{var_name}' was already declared.")
-
+        # Re-declaration errors are raised by the `_resolve` pass.
         if node.value:
             val = self.visit(node.value)
         else:
-            val = _default_var_type(node)
+            val = _default_var_value(node)
 
-        variables[var_name] = val
+        self._store(self._curr_ctx().slots, node.slot, val)
 
     def visit_ConstDecl(self, node: ConstDecl) -> None:
-        constants = self._curr_ctx().constants
-        var_name = node.name.value
-        if var_name in constants or var_name in self._curr_ctx().variables:
-            raise WabbitRuntimeError("Constant '{var_name}' was already declared.")
-
-        constants[var_name] = self.visit(node.value)
+        self._store(self._curr_ctx().slots, node.slot, self.visit(node.value))
 
     def visit_FuncArg(self, farg_node: FuncArg) -> "_VarDef":
         return _VarDef(type_=_var_type(farg_node.type_), name=farg_node.name.value)
@@ -153,18 +261,39 @@ class _Interpreter(Visitor):
         args = [self.visit_FuncArg(a) for a in func_def.args]
         ret_type = _var_type(func_def.return_type)
         func_name = func_def.name.value
-        f = _Function(name=func_name, args=args, ret_type=ret_type, body=func_def.body)
+        f = _Function(
+            name=func_name,
+            args=args,
+            arg_names=tuple(a.name for a in args),
+            ret_type=ret_type,
+            body=func_def.body,
+            local_count=func_def.local_count,
+        )
         self._curr_ctx().functions[func_name] = f
 
     def visit_FuncCall(self, callf: FuncCall) -> t.Any:
         func = self._curr_ctx().functions[callf.name.value]
 
-        func_ctx = _ExecCtx()
-        func_ctx.functions = self._curr_ctx().functions
+        # Hot functions run as native Python: translate the body once at first
+        # call and keep interpreting only what the code generator cannot handle.
+        if func.py_fn is None and not func.py_fn_failed:
+            self._jit_compile(func)
+
+        if func.py_fn is not None:
+            args = [self.visit(a) for a in callf.args]
+            try:
+                return func.py_fn(*args)
+            except (UnboundLocalError, NameError) as e:
+                # A read of a variable whose declaration sat in a skipped
+                # branch - the same error class `visit_Name` reports.
+                raise _undefined_var_error(e)
+
+        # Argument slots come first in the function scope, in declaration order.
+        slots = [None] * func.local_count
         for argi, arg in enumerate(callf.args):
-            arg_value = self.visit(arg)
-            func_ctx.variables[func.args[argi].name] = arg_value
+            slots[argi] = self.visit(arg)
 
+        func_ctx = _ExecCtx(slots=slots, functions=self._curr_ctx().functions)
         self._exec_ctx.append(func_ctx)
 
         # Each function should have a return statement last.
@@ -176,39 +305,107 @@ class _Interpreter(Visitor):
         res = self.visit(node.value)
         return res
 
-    def visit_Assignment(self, node: Assignment) -> "_DataType":
+    def visit_Assignment(self, node: Assignment) -> _DataTypes:
         assert isinstance(node.left, Name)
-        var_name = node.left.value
 
         value = self.visit(node.right)
-        self._curr_ctx().variables[var_name] = value
+        self._store(self._curr_ctx().slots, node.left.slot, value)
 
         return value
 
     def visit_IfElse(self, node: IfElse) -> None:
         test_res = self.visit(node.test)
-        if type(test_res) is not _BooleanVar:
-            raise WabbitRuntimeError(
-                f"If condition mus evaluate to boolean. Rather it was '{test_res}'"
-            )
+        # A correctness guard, not interpreter logic: a type-check pass should
+        # enforce this once. `python -O` strips it from the hot path.
+        if __debug__:
+            if type(test_res) is not bool:
+                raise WabbitRuntimeError(
+                    f"If condition mus evaluate to boolean. Rather it was '{test_res}'"
+                )
 
-        if test_res.value:
+        if test_res:
             self.visit(node.body)
         elif else_body := node.else_body:
             self.visit(else_body)
 
     def visit_While(self, node: While) -> None:
-        while True:
-            test_res = self.visit(node.test)
-            if type(test_res) is not _BooleanVar:
-                raise WabbitRuntimeError(
-                    f"If condition mus evaluate to boolean. Rather it was '{type(test_res)}'"
+        # Loops outside any function are where interpreted programs burn their
+        # time, and `_jit_compile` never sees them. Translate the whole loop
+        # into a Python function over its variables once, run it natively and
+        # write the updated values back into the slots.
+        if id(node) not in self._py_loops:
+            try:
+                loop_fn, var_slots, var_names = _codegen_py.compile_loop(
+                    node, self._py_env
+                )
+                self._py_loops[id(node)] = (loop_fn, var_slots, var_names, node)
+            except _codegen_py.Unsupported:
+                self._py_loops[id(node)] = None
+
+        if jit := self._py_loops[id(node)]:
+            loop_fn, var_slots, var_names, _ = jit
+            slots = self._curr_ctx().slots
+            args = [slots[s] if s < len(slots) else None for s in var_slots]
+            try:
+                results = loop_fn(*args)
+            except (UnboundLocalError, NameError) as e:
+                raise _undefined_var_error(e)
+            except TypeError:
+                # Hole slots (declarations skipped at run time, see `_store`)
+                # are passed in as None; an operator tripping over one is an
+                # undefined-variable read, not an interpreter bug.
+                hole = next(
+                    (n for n, v in zip(var_names, args) if v is None), None
                 )
+                if hole is not None:
+                    raise WabbitRuntimeError(f"Undefined variable '{hole}'")
+                raise
+            for s, value in zip(var_slots, results):
+                self._store(slots, s, value)
+            return
+
+        # The loop core skips the generic dispatch: the test handler and the
+        # (handler, node) pairs of the body are resolved once per While node.
+        cached = self._while_handlers.get(id(node))
+        if cached is None:
+            dispatch = self._dispatch
+            cached = (
+                dispatch[type(node.test)],
+                [(dispatch[type(n)], n) for n in node.body.nodes],
+                node,
+            )
+            self._while_handlers[id(node)] = cached
+        test_handler, body_handlers, _ = cached
 
-            if test_res.value:
-                self.visit(node.body)
-            else:
+        test = node.test
+        while True:
+            test_res = test_handler(test)
+            if __debug__:
+                if type(test_res) is not bool:
+                    raise WabbitRuntimeError(
+                        f"If condition mus evaluate to boolean. Rather it was '{type(test_res)}'"
+                    )
+
+            if not test_res:
                 break
+            for handler, n in body_handlers:
+                handler(n)
+
+    @staticmethod
+    def _store(slots: list, slot: int, value: _DataTypes) -> None:
+        # Slots are handed out in declaration order but a declaration inside an
+        # `if` body may be skipped at run time, so the list can have holes.
+        if slot >= len(slots):
+            slots.extend([None] * (slot + 1 - len(slots)))
+        slots[slot] = value
+
+    def _jit_compile(self, func: "_Function") -> None:
+        try:
+            func.py_fn = _codegen_py.compile_function(
+                func.name, func.arg_names, func.body, self._py_env
+            )
+        except _codegen_py.Unsupported:
+            func.py_fn_failed = True
 
     def _curr_ctx(self) -> "_ExecCtx":
         assert (
@@ -217,138 +414,18 @@ class _Interpreter(Visitor):
         return self._exec_ctx[-1]
 
 
-class _ExecCtx(BaseModel):
-    variables: dict[str, "_DataType"] = {}
-    # TODO(povilas): rm and do const checking before interpreting
-    constants: dict[str, "_DataType"] = {}
-    functions: dict[str, "_Function"] = {}
-
-
-class _DataType:
-    """Handles Wabbit data type operations."""
-
-    type_: t.ClassVar[type[_DataTypes]] = int
-
-    def __init__(self, value: _DataTypes) -> None:
-        self.value = value
-
-    @classmethod
-    def default(cls) -> "_DataType":
-        raise _UnsupportedOperation(cls.type_, "default")
-
-    def add(self, other: "_DataType") -> "_DataType":
-        return type(self)(self.value + self._assert_same_type(other).value)
+# Plain slotted dataclasses: an _ExecCtx is allocated on every function call
+# and pydantic's per-field validation made that needlessly expensive.
+@dataclass(slots=True)
+class _ExecCtx:
+    slots: list = field(default_factory=list)
+    """Variable (and constant) values indexed by the slots `_resolve` assigned."""
+    # TODO(povilas): do const re-assignment checking before interpreting
+    functions: dict[str, "_Function"] = field(default_factory=dict)
 
-    def sub(self, other: "_DataType") -> _DataTypes:
-        return type(self)(self.value - self._assert_same_type(other).value)
 
-    def mul(self, other: "_DataType") -> _DataTypes:
-        return type(self)(self.value * self._assert_same_type(other).value)
-
-    def div(self, other: "_DataType") -> _DataTypes:
-        return type(self)(self.value / self._assert_same_type(other).value)
-
-    def unary_minus(self) -> _DataTypes:
-        raise _UnsupportedOperation(self.type_, "-x")
-
-    def unary_plus(self) -> _DataTypes:
-        raise _UnsupportedOperation(self.type_, "+x")
-
-    def cmp_eq(self, other: "_DataType") -> _DataTypes:
-        return _BooleanVar(self.value == self._assert_same_type(other).value)
-
-    def cmp_not_eq(self, other: "_DataType") -> _DataTypes:
-        return _BooleanVar(self.value != self._assert_same_type(other).value)
-
-    def cmp_less(self, other: "_DataType") -> _DataTypes:
-        return _BooleanVar(self.value < self._assert_same_type(other).value)
-
-    def cmp_less_eq(self, other: "_DataType") -> _DataTypes:
-        return _BooleanVar(self.value <= self._assert_same_type(other).value)
-
-    def cmp_more(self, other: "_DataType") -> _DataTypes:
-        return _BooleanVar(self.value > self._assert_same_type(other).value)
-
-    def cmp_more_eq(self, other: "_DataType") -> _DataTypes:
-        return _BooleanVar(self.value >= self._assert_same_type(other).value)
-
-    def logical_not(self) -> _DataTypes:
-        raise _UnsupportedOperation(self.type_, "!")
-
-    def logical_and(self, other: "_DataType") -> _DataTypes:
-        raise _UnsupportedOperation(self.type_, "&&")
-
-    def logical_or(self, other: "_DataType") -> _DataTypes:
-        raise _UnsupportedOperation(self.type_, "||")
-
-    def __repr__(self) -> str:
-        return f"{self.__class__.__name__}({self.value})"
-
-    def _assert_same_type(self, other: "_DataType") -> "_DataType":
-        if self.type_ != other.type_:
-            raise WabbitTypeError(
-                f"Incompatible types '{self.type_.__name__}' and '{other.type_.__name__}"
-            )
-        return other
-
-
-class _IntegerVar(_DataType):
-    type_ = int
-
-    @classmethod
-    def default(cls) -> "_IntegerVar":
-        return cls(0)
-
-    def div(self, other: "_DataType") -> "_IntegerVar":
-        return type(self)(int(self.value / self._assert_same_type(other).value))
-
-    def unary_minus(self) -> "_IntegerVar":
-        return type(self)(-self.value)
-
-    def unary_plus(self) -> "_IntegerVar":
-        return self
-
-
-class _FloatVar(_DataType):
-    type_ = float
-
-    @classmethod
-    def default(cls) -> "_FloatVar":
-        return cls(0.0)
-
-    def unary_minus(self) -> "_FloatVar":
-        return type(self)(-self.value)
-
-    def unary_plus(self) -> "_FloatVar":
-        return self
-
-
-class _BooleanVar(_DataType):
-    type_ = bool
-
-    @classmethod
-    def default(cls) -> "_BooleanVar":
-        return cls(False)
-
-    def logical_not(self) -> "_BooleanVar":
-        return type(self)(not self.value)
-
-    def logical_and(self, other: "_DataType") -> "_BooleanVar":
-        return type(self)(self.value and self._assert_same_type(other).value)
-
-    def logical_or(self, other: "_DataType") -> "_BooleanVar":
-        return type(self)(self.value or self._assert_same_type(other).value)
-
-
-class _CharVar(_DataType):
-    type_ = str
-
-    @classmethod
-    def default(cls) -> "_CharVar":
-        return cls("\0")
-
-
-class _VarDef(BaseModel):
+@dataclass(slots=True)
+class _VarDef:
     # TODO(povilas): I'm using the in | float | bool ... types here
     # But all I really need is some placeholders like TInt that I could later map
     # To the interpreted environment type like 'int'.
@@ -356,26 +433,44 @@ class _VarDef(BaseModel):
     name: str
 
 
-class _Function(BaseModel):
-    """Wabbit functions are not first class citizens and thus do not derive from
-    _DataType."""
+@dataclass(slots=True)
+class _Function:
+    """Wabbit functions are not first class citizens and thus are not stored
+    among variables."""
 
     name: str
     args: list[_VarDef]
+    arg_names: tuple[str, ...]
+    """Precomputed from `args`: the JIT translation wants just the names."""
     ret_type: type[_DataTypes]
     body: Statements
+    local_count: int
+    """How many variable slots a call frame needs (arguments included)."""
+    py_fn: t.Callable | None = None
+    """The body translated to a Python callable, cached at first call."""
+    py_fn_failed: bool = False
+    """Set when translation was attempted and is not possible for this body."""
+
+
+def _undefined_var_error(e: Exception) -> WabbitRuntimeError:
+    """Translate an UnboundLocalError/NameError escaping JIT'd code.
+
+    `e.name` is not always populated (UnboundLocalError on CPython 3.11),
+    so fall back to the quoted name in the message."""
+    name = getattr(e, "name", None) or str(e).partition("'")[2].partition("'")[0]
+    return WabbitRuntimeError(f"Undefined variable '{name}'")
 
 
-def _default_var_type(node: VarDecl) -> _DataType:
+def _default_var_value(node: VarDecl) -> _DataTypes:
     match node.type_:
         case Type(name="int"):
-            return _IntegerVar.default()
+            return 0
         case Type(name="float"):
-            return _FloatVar.default()
+            return 0.0
         case Type(name="bool"):
-            return _BooleanVar.default()
+            return False
         case Type(name="char"):
-            return _CharVar.default()
+            return "\0"
         case _:
             assert False, f"Unknown variable type: {node.type_}"
 
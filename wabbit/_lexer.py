@@ -1,10 +1,67 @@
 """Lexical Wabbit language analysis."""
 
+import enum
+import re
+import sys
+
 from ._errors import WabbitSyntaxError
 
 
+class TT(enum.IntEnum):
+    """Token types.
+
+    Plain ints compare a lot faster than strings - the parser peeks at token
+    types on every decision it makes.
+    """
+
+    NAME = enum.auto()
+    INTEGER = enum.auto()
+    FLOAT = enum.auto()
+    CHAR = enum.auto()
+
+    # Keywords.
+    PRINT = enum.auto()
+    VAR = enum.auto()
+    CONST = enum.auto()
+    IF = enum.auto()
+    ELSE = enum.auto()
+    WHILE = enum.auto()
+    BREAK = enum.auto()
+    CONTINUE = enum.auto()
+    FUNC = enum.auto()
+    RETURN = enum.auto()
+    TRUE = enum.auto()
+    FALSE = enum.auto()
+
+    # Symbols.
+    ADD = enum.auto()
+    SUB = enum.auto()
+    MULTIPLY = enum.auto()
+    DIVIDE = enum.auto()
+    LESS = enum.auto()
+    MORE = enum.auto()
+    EQUAL = enum.auto()
+    LESS_EQ = enum.auto()
+    MORE_EQ = enum.auto()
+    DOUBLE_EQ = enum.auto()
+    NOT_EQ = enum.auto()
+    LOGICAL_NOT = enum.auto()
+    LOGICAL_AND = enum.auto()
+    LOGICAL_OR = enum.auto()
+    OPEN_PARENS = enum.auto()
+    CLOSE_PARENS = enum.auto()
+    OPEN_CURLY_BRACE = enum.auto()
+    CLOSE_CURLY_BRACE = enum.auto()
+    SEMICOLON = enum.auto()
+    COMMA = enum.auto()
+
+
 class Token:
-    def __init__(self, type_: str, value: str, pos: int) -> None:
+    # Tokens are the most numerous objects a parse creates; slots drop the
+    # per-instance __dict__ and make the parser's `.type` reads offset loads.
+    __slots__ = ("type", "value", "pos")
+
+    def __init__(self, type_: TT, value: str, pos: int) -> None:
         self.type = type_
         self.value = value
         self.pos = pos
@@ -13,30 +70,30 @@ class Token:
         return self.type == o.type and self.value == o.value and self.pos == o.pos
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}({self.type}, {self.value}, {self.pos})"
+        return f"{self.__class__.__name__}({self.type.name}, {self.value}, {self.pos})"
 
 
 _SYMBOL_TOKENS = {
-    "+": "ADD",
-    "-": "SUB",
-    "*": "MULTIPLY",
-    "/": "DIVIDE",
-    "<": "LESS",
-    ">": "MORE",
-    "=": "EQUAL",
-    "<=": "LESS_EQ",
-    ">=": "MORE_EQ",
-    "==": "DOUBLE_EQ",
-    "!=": "NOT_EQ",
-    "!": "LOGICAL_NOT",
-    "&&": "LOGICAL_AND",
-    "||": "LOGICAL_OR",
-    "(": "OPEN_PARENS",
-    ")": "CLOSE_PARENS",
-    "{": "OPEN_CURLY_BRACE",
-    "}": "CLOSE_CURLY_BRACE",
-    ";": "SEMICOLON",
-    ",": "COMMA",
+    "+": TT.ADD,
+    "-": TT.SUB,
+    "*": TT.MULTIPLY,
+    "/": TT.DIVIDE,
+    "<": TT.LESS,
+    ">": TT.MORE,
+    "=": TT.EQUAL,
+    "<=": TT.LESS_EQ,
+    ">=": TT.MORE_EQ,
+    "==": TT.DOUBLE_EQ,
+    "!=": TT.NOT_EQ,
+    "!": TT.LOGICAL_NOT,
+    "&&": TT.LOGICAL_AND,
+    "||": TT.LOGICAL_OR,
+    "(": TT.OPEN_PARENS,
+    ")": TT.CLOSE_PARENS,
+    "{": TT.OPEN_CURLY_BRACE,
+    "}": TT.CLOSE_CURLY_BRACE,
+    ";": TT.SEMICOLON,
+    ",": TT.COMMA,
 }
 
 # TODO(povilas): add int, float, bool, char
@@ -55,52 +112,80 @@ _KEYWORDS = {
     "false",
 }
 
+# Keyword lexeme -> token type: classifying a matched name is then one dict
+# get, with no .upper() allocation and no enum name lookup per keyword.
+_KEYWORD_TT = {kw: TT[kw.upper()] for kw in _KEYWORDS}
 
-def tokenize(text: str) -> list[Token]:
-    pos = 0
-    tokens: list[Token] = []
-
-    while pos < len(text):
-        # NOTE: order matters - match comments first, float before int, etc.
-        if m := match_block_comment(text, pos):
-            pass
-        elif m := match_line_comment(text, pos):
-            pass
 
-        elif m := match_name(text, pos):
-            if m in _KEYWORDS:
-                tokens.append(Token(m.upper(), m, pos))
-            else:
-                tokens.append(Token("NAME", m, pos))
+# Every token alternative fused into one named-group alternation: the regex
+# engine tries them in C without returning to Python between alternatives, so
+# the loop below runs once per lexeme instead of once per trial matcher.
+# NOTE: order matters - comments before symbols, float before int, etc.
+_MASTER = re.compile(
+    r"(?P<COMMENT>/\*.*?\*/|//[^\n]*\n?)"
+    r"|(?P<NAME>[A-Za-z_][A-Za-z_0-9]*)"
+    r"|(?P<FLOAT>[0-9]+\.[0-9]*|\.[0-9]+)"
+    r"|(?P<INTEGER>[0-9]+)"
+    r"|(?P<CHAR>'[^']*')"
+    r"|(?P<SYMBOL><=|>=|==|!=|&&|\|\||[-+*/<>=!(){};,])"
+    r"|(?P<WS>\s+)",
+    re.DOTALL,  # block comments span lines
+)
 
-        elif m := match_float(text, pos):
-            tokens.append(Token("FLOAT", m, pos))
-        elif m := match_digits(text, pos):
-            tokens.append(Token("INTEGER", m, pos))
 
-        elif m := _match_char(text, pos):
-            tokens.append(Token("CHAR", m, pos))
-
-        elif m := match_symbol(text, pos):
-            tokens.append(Token(_SYMBOL_TOKENS[m], m, pos))
+def tokenize(text: str) -> list[Token]:
+    pos = 0
+    end = len(text)
+    tokens: list[Token] = []
+    append = tokens.append
+    match = _MASTER.match
 
-        elif m := match_whitespace(text, pos):
-            pass
-        else:
+    while pos < end:
+        if (m := match(text, pos)) is None:
             raise WabbitSyntaxError(
                 f"Could not match a token at position {pos}: '{text[pos:pos+10]}...'"
             )
 
-        pos += len(m)
+        kind = m.lastgroup
+        value = m[0]
+        if kind == "NAME":
+            if (tok_type := _KEYWORD_TT.get(value)) is not None:
+                append(Token(tok_type, value, pos))
+            else:
+                # Interned: every later `==` on an identifier (and its use as
+                # a dict key) then short-circuits on pointer equality.
+                append(Token(TT.NAME, sys.intern(value), pos))
+        elif kind == "SYMBOL":
+            # Two-char symbols ("<=", "&&", ...) are fresh slice objects; the
+            # parser copies them into `operation` fields, so intern them too.
+            append(Token(_SYMBOL_TOKENS[value], sys.intern(value), pos))
+        elif kind == "INTEGER":
+            append(Token(TT.INTEGER, value, pos))
+        elif kind == "FLOAT":
+            append(Token(TT.FLOAT, value, pos))
+        elif kind == "CHAR":
+            append(Token(TT.CHAR, value, pos))
+        # COMMENT and WS produce no token.
+
+        pos = m.end()
 
     return tokens
 
 
+# The standalone matchers below are the reference implementation of each
+# token class, kept in sync with `_MASTER` and exercised by the inline
+# asserts. They are driven by precompiled patterns: one C-level scan per
+# lexeme instead of a Python-bytecode loop with an isdigit()/isalpha() call
+# per character.
+_RE_DIGITS = re.compile(r"[0-9]+")
+_RE_NAME = re.compile(r"[A-Za-z_][A-Za-z_0-9]*")
+_RE_FLOAT = re.compile(r"[0-9]+\.[0-9]*|\.[0-9]+")
+_RE_WS = re.compile(r"\s+")
+
+
 def match_digits(text: str, start: int = 0) -> str:
-    n = start
-    while n < len(text) and text[n].isdigit():
-        n += 1
-    return text[start:n]
+    m = _RE_DIGITS.match(text, start)
+    return m[0] if m else ""
 
 
 assert match_digits("12345") == "12345"
@@ -111,21 +196,14 @@ assert match_digits("123abc456") == "123"  # Stops with first non-digit
 
 
 def _match_char(text: str, start: int = 0) -> str:
-    n = start
-    if n >= len(text):
+    if text[start : start + 1] != "'":
         return ""
 
-    if text[n] != "'":
-        return ""
-
-    n += 1
-    while n < len(text) and text[n] != "'":
-        n += 1
-
-    if text[n] == "'":
-        return text[start : n + 1]
-
-    return ""
+    # As with the comment matchers: C-level search for the closing quote
+    # instead of a per-character loop that also read past the end when the
+    # literal was unterminated.
+    end = text.find("'", start + 1)
+    return text[start : end + 1] if end != -1 else ""
 
 
 assert _match_char("'x'") == "'x'"
@@ -133,15 +211,8 @@ assert _match_char("'\\n'") == "'\\n'"
 
 
 def match_name(text: str, start: int = 0) -> str:
-    n = start
-    while n < len(text) and (text[n].isalpha() or text[n] == "_"):
-        n += 1
-
-    if n == start:
-        return ""
-
-    suffix = match_digits(text[n:]) if n > 0 else ""
-    return text[start:n] + suffix
+    m = _RE_NAME.match(text, start)
+    return m[0] if m else ""
 
 
 assert match_name("print") == "print"
@@ -150,16 +221,20 @@ assert match_name("abc_123") == "abc_123"
 assert match_name("abc 123") == "abc"
 
 
-def match_symbol(text: str, start: int = 0) -> str:
-    symbols1 = {"+", "-", "*", "/", "<", ">", "=", "(", ")", "{", "}", ";", "!", ","}
-    symbols2 = {"<=", ">=", "==", "&&", "||", "!="}
-
-    if start + 2 <= len(text) and text[start : start + 2] in symbols2:
-        return text[start : start + 2]
+# Hoisted out of match_symbol: the sets were rebuilt on every call. The
+# first-char set gates the two-char lookup so the common single-symbol case
+# never allocates the 2-char slice.
+_SYM1 = frozenset("+-*/<>=(){};!,")
+_SYM2 = frozenset({"<=", ">=", "==", "&&", "||", "!="})
+_SYM2_FIRST = frozenset("<>=&|!")
 
-    if start < len(text) and text[start] in symbols1:
-        return text[start]
 
+def match_symbol(text: str, start: int = 0) -> str:
+    c = text[start : start + 1]
+    if c in _SYM2_FIRST and text[start : start + 2] in _SYM2:
+        return text[start : start + 2]
+    if c in _SYM1:
+        return c
     return ""
 
 
@@ -171,21 +246,14 @@ assert match_symbol("print true && true", 11) == "&&"
 
 
 def match_block_comment(text: str, start: int = 0) -> str:
-    if len(text) < start + 4:
-        return ""
-
     if text[start : start + 2] != "/*":
         return ""
 
-    n = start + 2
-    while n < len(text) and text[n] != "*":
-        n += 1
-    n += 1  # skip '*'
-
-    if text[n] == "/":
-        return text[start : n + 1]
-
-    return ""
+    # C-level substring search instead of a per-character loop. The old loop
+    # stopped at the first '*' (rejecting comments that contain one) and read
+    # past the end on unterminated comments.
+    end = text.find("*/", start + 2)
+    return text[start : end + 2] if end != -1 else ""
 
 
 assert match_block_comment("/**/") == "/**/"
@@ -195,41 +263,19 @@ assert match_block_comment("123 /* Line1\nLine2\n */", 4) == "/* Line1\nLine2\n
 
 
 def match_line_comment(text: str, start: int = 0) -> str:
-    if len(text) < start + 2:
-        return ""
-
-    if not text[start : start + 2] == "//":
+    if text[start : start + 2] != "//":
         return ""
 
-    n = start + 2
-    while n < len(text) and text[n] != "\n":
-        n += 1
-
-    eof = n == len(text)
-    if n < len(text) and text[n] == "\n" or eof:
-        return text[start : n + 1]
-
-    return ""
+    nl = text.find("\n", start + 2)
+    return text[start : nl + 1] if nl != -1 else text[start:]
 
 
 assert match_line_comment("// Comment\n") == "// Comment\n"
 
 
 def match_float(text: str, start: int = 0) -> str:
-    if digits := match_digits(text, start):
-        dot_pos = start + len(digits)
-        if dot_pos >= len(text) or not text[dot_pos] == ".":
-            return ""
-
-        if more_digits := match_digits(text, dot_pos + 1):
-            return text[start : dot_pos + len(more_digits) + 1]
-
-        return text[start : dot_pos + 1]
-
-    elif text[start] == "." and (digits := match_digits(text, start + 1)):
-        return text[start : len(digits) + 1]
-
-    return ""
+    m = _RE_FLOAT.match(text, start)
+    return m[0] if m else ""
 
 
 assert match_float("3.14159") == "3.14159"
@@ -241,10 +287,8 @@ assert match_float(".") == ""
 
 
 def match_whitespace(text: str, start: int = 0) -> str:
-    n = start
-    while n < len(text) and text[n].isspace():
-        n += 1
-    return text[start:n]
+    m = _RE_WS.match(text, start)
+    return m[0] if m else ""
 
 
 assert match_whitespace("abc") == ""
@@ -252,9 +296,9 @@ assert match_whitespace(" abc") == " "
 assert match_whitespace("   abc") == "   "
 
 assert tokenize("print 123 + 1.2;") == [
-    Token("PRINT", "print", 0),
-    Token("INTEGER", "123", 6),
-    Token("ADD", "+", 10),
-    Token("FLOAT", "1.2", 12),
-    Token("SEMICOLON", ";", 15),
+    Token(TT.PRINT, "print", 0),
+    Token(TT.INTEGER, "123", 6),
+    Token(TT.ADD, "+", 10),
+    Token(TT.FLOAT, "1.2", 12),
+    Token(TT.SEMICOLON, ";", 15),
 ]
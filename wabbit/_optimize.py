@@ -0,0 +1,90 @@
+"""AST-level optimizations applied between parsing and execution.
+
+Not used by the formatter: `wabbit.format` must reproduce the source as
+written, so folding `2 * 3 + 4` into `10` there would be a bug. The
+interpreter entry points run this pass before executing.
+"""
+
+import dataclasses
+
+from ._ast import *
+
+
+def fold_constants(node: Node) -> Node:
+    """Evaluate pure-literal expression subtrees once, at compile time.
+
+    `2 * 3 + 4` parses into two BinOps that a loop body would otherwise
+    re-evaluate on every iteration; after this pass it is a single Integer
+    node. Mutates the tree in place and returns it. Division by a literal
+    zero is left unfolded so it still raises at runtime, where it occurred.
+    """
+    return _fold(node)
+
+
+def _fold(node: Node) -> Node:
+    # Generic bottom-up walk over the dataclass fields, mirroring how
+    # `_codegen_py._collect_slots` traverses the tree.
+    for f in dataclasses.fields(node):
+        child = getattr(node, f.name)
+        if isinstance(child, Node):
+            setattr(node, f.name, _fold(child))
+        elif type(child) is tuple:
+            setattr(
+                node,
+                f.name,
+                tuple(_fold(c) if isinstance(c, Node) else c for c in child),
+            )
+
+    cls = type(node)
+    if cls is ParenExpr:
+        # Grouping carries no runtime meaning; the operand evaluates the same
+        # without the forwarding node.
+        return node.value
+    if cls is BinOp:
+        return _fold_binop(node)
+    if cls is UnaryOp:
+        return _fold_unaryop(node)
+    return node
+
+
+def _fold_binop(node: BinOp) -> Expression:
+    left, right = node.left, node.right
+    if type(left) is Integer and type(right) is Integer:
+        a, b = left.num, right.num
+        match node.operation:
+            case "+":
+                return Integer(value=str(a + b))
+            case "-":
+                return Integer(value=str(a - b))
+            case "*":
+                return Integer(value=str(a * b))
+            case "/" if b != 0:
+                # Wabbit integer division truncates towards zero.
+                return Integer(value=str(int(a / b)))
+    elif type(left) is Float and type(right) is Float:
+        a, b = left.num, right.num
+        match node.operation:
+            case "+":
+                return Float(value=str(a + b))
+            case "-":
+                return Float(value=str(a - b))
+            case "*":
+                return Float(value=str(a * b))
+            case "/" if b != 0.0:
+                return Float(value=str(a / b))
+    return node
+
+
+def _fold_unaryop(node: UnaryOp) -> Expression:
+    operand = node.operand
+    operand_cls = type(operand)
+    match node.operation:
+        case "-" if operand_cls is Integer:
+            return Integer(value=str(-operand.num))
+        case "-" if operand_cls is Float:
+            return Float(value=str(-operand.num))
+        case "+" if operand_cls is Integer or operand_cls is Float:
+            return operand
+        case "!" if operand_cls is Boolean:
+            return Boolean(value=not operand.value)
+    return node
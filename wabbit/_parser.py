@@ -1,150 +1,182 @@
+import hashlib
+import os
+import pickle
 import typing as t
+from pathlib import Path
 
-from ._lexer import Token, tokenize
+from ._lexer import TT, Token, tokenize
 from ._ast import *
 from ._errors import WabbitSyntaxError
 
-TokenType: t.TypeAlias = t.Literal["INTEGER"] | str
+TokenType: t.TypeAlias = TT
 
 
 def parse_file(fname: str) -> Statements:
+    """Parse a Wabbit source file.
+
+    Parsing is pure and deterministic, so the resulting AST is cached on disk
+    keyed by a hash of the source text: re-running an unchanged file skips
+    tokenizing and parsing altogether.
+    """
     with open(fname) as f:
         source = f.read()
-        return parse_source(source)
+
+    cache_file = _ast_cache_file(source)
+    if (ast := _load_cached_ast(cache_file)) is not None:
+        return ast
+
+    ast = parse_source(source)
+    _cache_ast(cache_file, ast)
+    return ast
+
+
+def _ast_cache_file(source: str) -> Path:
+    digest = hashlib.blake2b(source.encode()).hexdigest()
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_home / "wabbit" / f"{digest}.pkl"
+
+
+def _load_cached_ast(cache_file: Path) -> Statements | None:
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # A missing or corrupt cache entry - or one pickled by an older wabbit
+        # version with a different AST shape - just means we parse again.
+        return None
+
+
+def _cache_ast(cache_file: Path, ast: Statements) -> None:
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "wb") as f:
+            pickle.dump(ast, f)
+    except OSError:
+        pass
 
 
 def parse_source(text: str) -> Statements:
-    tokens = tokenize(text)
-    return _parse_program(_TokenStream(tokens))
+    return Statements(nodes=tuple(parse_source_iter(text)))
 
 
-def _parse_program(tokens: "_TokenStream") -> Statements:
-    ast = Statements(nodes=[])
+def parse_source_iter(text: str) -> t.Iterator[Statement]:
+    """Yield top-level statements one at a time.
 
-    while not tokens.eof():
-        if stmt := _parse_statement(tokens):
-            ast.nodes.append(stmt)
+    Lets a consumer process statements while earlier ones (and their token
+    ranges) can already be collected, instead of holding the token list and
+    the full AST alive at the same time.
+    """
+    tokens = _TokenStream(tokenize(text))
+    eof = tokens.eof
 
-    return ast
+    while not eof():
+        if stmt := _parse_statement(tokens):
+            yield stmt
 
 
 def _parse_statement(tokens: "_TokenStream") -> Statement:
-    if tokens.peek("BREAK"):
-        return _parse_break_statement(tokens)
-    elif tokens.peek("CONTINUE"):
-        return _parse_continue_statement(tokens)
-    elif tokens.peek("PRINT"):
-        return _parse_print_statement(tokens)
-    elif tokens.peek("CONST"):
-        return _parse_const_statement(tokens)
-    elif tokens.peek("VAR"):
-        return _parse_var_statement(tokens)
-    elif tokens.peek("IF"):
-        return _parse_if_statement(tokens)
-    elif tokens.peek("WHILE"):
-        return _parse_while_statement(tokens)
-    elif tokens.peek("FUNC"):
-        return _parse_func_def(tokens)
-    elif tokens.peek("RETURN"):
-        return _parse_return_statement(tokens)
-    else:
-        return _parse_expression_as_statement(tokens)
+    # One dict lookup on the current token type instead of up to nine peek
+    # calls in a row; see `_STMT_DISPATCH` at the bottom of the module.
+    handler = _STMT_DISPATCH.get(tokens.current().type)
+    if handler is not None:
+        return handler(tokens)
+    return _parse_expression_as_statement(tokens)
 
 
 def _parse_break_statement(tokens: "_TokenStream") -> Break:
-    t = tokens.expect("BREAK")
-    tokens.expect("SEMICOLON")
+    t = tokens.expect(TT.BREAK)
+    tokens.expect(TT.SEMICOLON)
     return Break(location=t.pos)
 
 
 def _parse_continue_statement(tokens: "_TokenStream") -> Continue:
-    t = tokens.expect("CONTINUE")
-    tokens.expect("SEMICOLON")
+    t = tokens.expect(TT.CONTINUE)
+    tokens.expect(TT.SEMICOLON)
     return Continue(location=t.pos)
 
 
 def _parse_print_statement(tokens: "_TokenStream") -> PrintStatement:
-    t = tokens.expect("PRINT")
+    t = tokens.expect(TT.PRINT)
     expr = _parse_expression(tokens)
-    tokens.expect("SEMICOLON")
+    tokens.expect(TT.SEMICOLON)
     return PrintStatement(location=t.pos, value=expr)
 
 
 def _parse_const_statement(tokens: "_TokenStream") -> ConstDecl:
-    t1 = tokens.expect("CONST")
+    t1 = tokens.expect(TT.CONST)
     name_node = _parse_name(tokens)
-    type_node = _parse_type(tokens) if tokens.peek("NAME") else None
+    type_node = _parse_type(tokens) if tokens.peek(TT.NAME) else None
 
-    tokens.expect("EQUAL")
+    tokens.expect(TT.EQUAL)
     val = _parse_expression(tokens)
-    tokens.expect("SEMICOLON")
+    tokens.expect(TT.SEMICOLON)
 
     return ConstDecl(location=t1.pos, name=name_node, value=val, type_=type_node)
 
 
 def _parse_var_statement(tokens: "_TokenStream") -> VarDecl:
-    t1 = tokens.expect("VAR")
+    t1 = tokens.expect(TT.VAR)
     name_node = _parse_name(tokens)
-    type_node = _parse_type(tokens) if tokens.peek("NAME") else None
+    type_node = _parse_type(tokens) if tokens.peek(TT.NAME) else None
 
-    if tokens.peek("EQUAL"):
-        tokens.expect("EQUAL")
+    if tokens.peek(TT.EQUAL):
+        tokens.advance()
         val = _parse_expression(tokens)
     else:
         val = None
 
-    tokens.expect("SEMICOLON")
+    tokens.expect(TT.SEMICOLON)
 
     return VarDecl(location=t1.pos, name=name_node, value=val, type_=type_node)
 
 
 def _parse_if_statement(tokens: "_TokenStream") -> IfElse:
-    t1 = tokens.expect("IF")
+    t1 = tokens.expect(TT.IF)
     test = _parse_expression(tokens)
     body = _parse_statements_block(tokens)
-    else_body = _parse_else_statement(tokens) if tokens.peek("ELSE") else None
+    if tokens.peek(TT.ELSE):
+        tokens.advance()
+        else_body = _parse_statements_block(tokens)
+    else:
+        else_body = None
     return IfElse(location=t1.pos, test=test, body=body, else_body=else_body)
 
 
-def _parse_else_statement(tokens: "_TokenStream") -> Statements:
-    tokens.expect("ELSE")
-    return _parse_statements_block(tokens)
-
-
 def _parse_while_statement(tokens: "_TokenStream") -> While:
-    t1 = tokens.expect("WHILE")
+    t1 = tokens.expect(TT.WHILE)
     test = _parse_expression(tokens)
     body = _parse_statements_block(tokens)
     return While(location=t1.pos, test=test, body=body)
 
 
 def _parse_return_statement(tokens: "_TokenStream") -> Return:
-    t1 = tokens.expect("RETURN")
+    t1 = tokens.expect(TT.RETURN)
     ret_val = _parse_expression(tokens)
-    tokens.expect("SEMICOLON")
+    tokens.expect(TT.SEMICOLON)
     return Return(location=t1.pos, value=ret_val)
 
 
 def _parse_statements_block(tokens: "_TokenStream") -> Statements:
     """Parse multiple statements surrounded by curly braces."""
-    tokens.expect("OPEN_CURLY_BRACE")
+    tokens.expect(TT.OPEN_CURLY_BRACE)
 
-    body = Statements(nodes=[])
-    while not tokens.peek("CLOSE_CURLY_BRACE"):
-        body.nodes.append(_parse_statement(tokens))
-    tokens.expect("CLOSE_CURLY_BRACE")
+    nodes: list[Node] = []
+    append = nodes.append
+    while not tokens.peek(TT.CLOSE_CURLY_BRACE):
+        append(_parse_statement(tokens))
+    tokens.expect(TT.CLOSE_CURLY_BRACE)
 
-    return body
+    return Statements(nodes=tuple(nodes))
 
 
 def _parse_expression_as_statement(tokens: "_TokenStream") -> ExprAsStatement:
     expr = _parse_expression(tokens)
-    tokens.expect("SEMICOLON")
+    tokens.expect(TT.SEMICOLON)
     return ExprAsStatement(expr=expr)
 
 
 def _parse_type(tokens: "_TokenStream") -> Type:
-    t = tokens.expect("NAME")
+    t = tokens.expect(TT.NAME)
     return Type(location=t.pos, name=t.value)
 
 
@@ -153,156 +185,167 @@ def _parse_expression(tokens: "_TokenStream") -> Expression:
 
 
 def _parse_assignment_or_expr(tokens: "_TokenStream") -> Expression:
-    left = _parse_or_or_expr(tokens)
-    if tokens.peek("EQUAL"):
-        tokens.expect("EQUAL")
-        right = _parse_or_or_expr(tokens)
+    left = _parse_binop_expr(tokens)
+    if tokens.peek(TT.EQUAL):
+        tokens.advance()
+        right = _parse_binop_expr(tokens)
         return Assignment(location=left.location, left=left, right=right)
 
     return left
 
 
-def _parse_or_or_expr(tokens: "_TokenStream") -> Expression:
-    left = _parse_and_or_expr(tokens)
-    while tok_op := tokens.peek_one_of("LOGICAL_OR"):
-        tokens.expect_one_of("LOGICAL_OR")
-        right = _parse_and_or_expr(tokens)
-        left = LogicalOp(
-            location=left.location, operation=tok_op.value, left=left, right=right
-        )
-    return left
-
-
-def _parse_and_or_expr(tokens: "_TokenStream") -> Expression:
-    """This is very similar to _parse_logical_cmp_or_expr() but makes sure the
-    precedence of `&&` operators over others:
-
-        a < b && c > d
-        (a < b) && (c > d)
+# Binary operator precedence, loosest binding first. One level per grammar rule
+# (logicalexpr / orterm / andterm / sumterm / multerm).
+_PRECEDENCE: t.Final[dict[TT, int]] = {
+    TT.LOGICAL_OR: 1,
+    TT.LOGICAL_AND: 2,
+    TT.LESS: 3,
+    TT.MORE: 3,
+    TT.LESS_EQ: 3,
+    TT.MORE_EQ: 3,
+    TT.DOUBLE_EQ: 3,
+    TT.NOT_EQ: 3,
+    TT.ADD: 4,
+    TT.SUB: 4,
+    TT.MULTIPLY: 5,
+    TT.DIVIDE: 5,
+}
+
+_ARITHMETIC_TOKENS = frozenset((TT.ADD, TT.SUB, TT.MULTIPLY, TT.DIVIDE))
+
+
+def _parse_binop_expr(tokens: "_TokenStream", min_prec: int = 1) -> Expression:
+    """Parse a chain of binary operations by precedence climbing.
+
+    One precedence-table lookup per operator replaces the old cascade of
+    `_parse_or_or_expr` -> ... -> `_parse_muldiv_or_expr` helper calls, which
+    cost 5 Python stack frames for every leaf factor.
     """
-    left = _parse_logical_cmp_or_expr(tokens)
-    while tok_op := tokens.peek_one_of("LOGICAL_AND"):
-        tokens.expect_one_of("LOGICAL_AND")
-        right = _parse_logical_cmp_or_expr(tokens)
-        left = LogicalOp(
-            location=left.location, operation=tok_op.value, left=left, right=right
-        )
-    return left
-
+    left = _parse_factor(tokens)
 
-def _parse_logical_cmp_or_expr(tokens: "_TokenStream") -> Expression:
-    cmp_tokens = ("LESS", "MORE", "LESS_EQ", "MORE_EQ", "DOUBLE_EQ", "NOT_EQ")
-    left = _parse_addsub_or_expr(tokens)
-    while tok_op := tokens.peek_one_of(*cmp_tokens):
-        tokens.expect_one_of(*cmp_tokens)
-        right = _parse_addsub_or_expr(tokens)
-        left = LogicalOp(
+    while not tokens.eof():
+        tok_op = tokens.current()
+        prec = _PRECEDENCE.get(tok_op.type, 0)
+        if prec < min_prec:
+            break
+
+        tokens.advance()  # `tok_op` is already in hand.
+        # `prec + 1` on the right-hand side makes every level left-associative.
+        right = _parse_binop_expr(tokens, prec + 1)
+        node_type = BinOp if tok_op.type in _ARITHMETIC_TOKENS else LogicalOp
+        left = node_type(
             location=left.location, operation=tok_op.value, left=left, right=right
         )
-    return left
-
 
-def _parse_addsub_or_expr(tokens: "_TokenStream") -> Expression:
-    left = _parse_muldiv_or_expr(tokens)
-    while tok_op := tokens.peek_one_of("ADD", "SUB"):
-        tokens.expect_one_of("ADD", "SUB")
-        right = _parse_muldiv_or_expr(tokens)
-        left = BinOp(
-            location=left.location, operation=tok_op.value, left=left, right=right
-        )
     return left
 
 
-def _parse_muldiv_or_expr(tokens: "_TokenStream") -> Expression:
-    left = _parse_factor(tokens)
+def _parse_factor(tokens: "_TokenStream") -> Expression:
+    # Same dict dispatch as `_parse_statement`; see `_FACTOR_DISPATCH` below.
+    handler = _FACTOR_DISPATCH.get(tokens.current().type)
+    if handler is not None:
+        return handler(tokens)
+    tokens.print_debug_info()
+    raise WabbitSyntaxError("Unexpected token for factor", tokens.current())
 
-    while tok_op := tokens.peek_one_of("MULTIPLY", "DIVIDE"):
-        tokens.expect_one_of("MULTIPLY", "DIVIDE")
-        right = _parse_factor(tokens)
-        left = BinOp(
-            location=left.location, operation=tok_op.value, left=left, right=right
-        )
 
-    return left
+def _parse_name_or_call(tokens: "_TokenStream") -> Expression:
+    if tokens.peek_all(TT.NAME, TT.OPEN_PARENS):
+        return _parse_func_call(tokens)
+    return _parse_name(tokens)
 
 
-def _parse_factor(tokens: "_TokenStream") -> Expression:
-    if tokens.peek("INTEGER"):
-        return _parse_integer(tokens)
-    elif tokens.peek("FLOAT"):
-        return _parse_float(tokens)
-    elif tokens.peek("TRUE"):
-        return _parse_true(tokens)
-    elif tokens.peek("FALSE"):
-        return _parse_false(tokens)
-    elif tokens.peek("CHAR"):
-        return _parse_character(tokens)
-    elif tokens.peek_all("NAME", "OPEN_PARENS"):
-        return _parse_func_call(tokens)
-    elif tokens.peek("NAME"):
-        return _parse_name(tokens)
-    elif tokens.peek_one_of("SUB", "ADD", "LOGICAL_NOT"):
-        return _parse_unaryop(tokens)
-    elif tokens.peek("OPEN_PARENS"):
-        tokens.expect("OPEN_PARENS")
-        factor = _parse_expression(tokens)
-        tokens.expect("CLOSE_PARENS")
-        return factor
-    else:
-        tokens.print_debug_info()
-        raise WabbitSyntaxError("Unexpected token for factor", tokens.current())
+def _parse_paren_expr(tokens: "_TokenStream") -> Expression:
+    tokens.expect(TT.OPEN_PARENS)
+    factor = _parse_expression(tokens)
+    tokens.expect(TT.CLOSE_PARENS)
+    return factor
 
 
 def _parse_name(tokens: "_TokenStream") -> Name:
-    t = tokens.expect("NAME")
+    t = tokens.expect(TT.NAME)
     return Name(location=t.pos, value=t.value)
 
 
+# Flyweight cache: programs repeat the same small literals (`0`, `1`, ...) a
+# lot and `Integer` nodes carry no per-occurrence state, so identical literals
+# can share one node. Interned nodes give up their `location`.
+_INT_CACHE: dict[str, Integer] = {}
+
+
 def _parse_integer(tokens: "_TokenStream") -> Integer:
-    t = tokens.expect("INTEGER")
-    return Integer(location=t.pos, value=t.value)
+    t = tokens.expect(TT.INTEGER)
+    node = _INT_CACHE.get(t.value)
+    if node is None:
+        node = _INT_CACHE[t.value] = Integer(value=t.value)
+    return node
+
+
+_FLOAT_CACHE: dict[str, Float] = {}
 
 
 def _parse_float(tokens: "_TokenStream") -> Float:
-    t = tokens.expect("FLOAT")
-    return Float(location=t.pos, value=t.value)
+    t = tokens.expect(TT.FLOAT)
+    node = _FLOAT_CACHE.get(t.value)
+    if node is None:
+        node = _FLOAT_CACHE[t.value] = Float(value=t.value)
+    return node
+
+
+# `true` and `false` carry no state at all - two singletons cover every
+# occurrence.
+_TRUE = Boolean(value=True)
+_FALSE = Boolean(value=False)
 
 
 def _parse_true(tokens: "_TokenStream") -> Boolean:
-    t = tokens.expect("TRUE")
-    return Boolean(location=t.pos, value=True)
+    tokens.expect(TT.TRUE)
+    return _TRUE
 
 
 def _parse_false(tokens: "_TokenStream") -> Boolean:
-    t = tokens.expect("FALSE")
-    return Boolean(location=t.pos, value=False)
+    tokens.expect(TT.FALSE)
+    return _FALSE
+
+
+# Character literals repeat a lot (e.g. '\n' after every print) - share one
+# node per distinct character, like `_INT_CACHE` does for integers.
+_CHAR_CACHE: dict[str, Character] = {}
 
 
 def _parse_character(tokens: "_TokenStream") -> Character:
-    t = tokens.expect("CHAR")
+    t = tokens.expect(TT.CHAR)
     value = t.value[1:-1]  # 'a' -> a
     if value == "\\n":
         value = "\n"
-    return Character(location=t.pos, value=value)
+
+    node = _CHAR_CACHE.get(value)
+    if node is None:
+        node = _CHAR_CACHE[value] = Character(value=value)
+    return node
 
 
 def _parse_func_def(tokens: "_TokenStream") -> FuncDef:
-    t1 = tokens.expect("FUNC")
+    t1 = tokens.expect(TT.FUNC)
     func_name = _parse_name(tokens)
 
-    tokens.expect("OPEN_PARENS")
+    tokens.expect(TT.OPEN_PARENS)
     func_args = []
-    while not tokens.peek("CLOSE_PARENS"):
+    while not tokens.peek(TT.CLOSE_PARENS):
         func_args.append(_parse_func_arg(tokens))
-        if tokens.peek("COMMA"):
-            tokens.expect("COMMA")
-    tokens.expect("CLOSE_PARENS")
+        if tokens.peek(TT.COMMA):
+            tokens.expect(TT.COMMA)
+    tokens.expect(TT.CLOSE_PARENS)
 
     ret_type = _parse_type(tokens)
     body = _parse_statements_block(tokens)
 
     return FuncDef(
-        location=t1.pos, name=func_name, args=func_args, return_type=ret_type, body=body
+        location=t1.pos,
+        name=func_name,
+        args=tuple(func_args),
+        return_type=ret_type,
+        body=body,
     )
 
 
@@ -314,70 +357,107 @@ def _parse_func_arg(tokens: "_TokenStream") -> FuncArg:
 
 def _parse_func_call(tokens: "_TokenStream") -> FuncCall:
     func_name = _parse_name(tokens)
-    tokens.expect("OPEN_PARENS")
+    tokens.expect(TT.OPEN_PARENS)
 
     args = []
-    while not tokens.peek("CLOSE_PARENS"):
+    while not tokens.peek(TT.CLOSE_PARENS):
         args.append(_parse_expression(tokens))
-        if tokens.peek("COMMA"):
-            tokens.expect("COMMA")
+        if tokens.peek(TT.COMMA):
+            tokens.expect(TT.COMMA)
 
-    tokens.expect("CLOSE_PARENS")
+    tokens.expect(TT.CLOSE_PARENS)
 
-    return FuncCall(location=func_name.location, name=func_name, args=args)
+    return FuncCall(location=func_name.location, name=func_name, args=tuple(args))
 
 
 def _parse_unaryop(tokens: "_TokenStream") -> UnaryOp:
-    t1 = tokens.expect_one_of("SUB", "ADD", "LOGICAL_NOT")
+    # Only reached through `_FACTOR_DISPATCH`, which already matched the
+    # operator token.
+    t1 = tokens.current()
+    tokens.advance()
     val = _parse_factor(tokens)
-    match t1.type:
-        case "SUB":
-            op = "-"
-        case "ADD":
-            op = "+"
-        case "LOGICAL_NOT":
-            op = "!"
-        case _:
-            assert False, f"Unexpected token for unary operator {t1.value}"
-
-    return UnaryOp(location=t1.pos, operation=op, operand=val)
+    # One dict lookup instead of a match/case comparison chain; a token type
+    # outside the map cannot reach here, so KeyError doubles as the assert.
+    return UnaryOp(location=t1.pos, operation=_UNARY_OPS[t1.type], operand=val)
+
+
+_UNARY_OPS: t.Final[dict[TT, str]] = {
+    TT.SUB: "-",
+    TT.ADD: "+",
+    TT.LOGICAL_NOT: "!",
+}
+
+# Statement/factor handlers keyed by the deciding token type. Built after the
+# handlers are defined; token types absent from a table fall through to the
+# default branch in the corresponding `_parse_*` function.
+_STMT_DISPATCH: t.Final[dict[TT, t.Callable[["_TokenStream"], Statement]]] = {
+    TT.BREAK: _parse_break_statement,
+    TT.CONTINUE: _parse_continue_statement,
+    TT.PRINT: _parse_print_statement,
+    TT.CONST: _parse_const_statement,
+    TT.VAR: _parse_var_statement,
+    TT.IF: _parse_if_statement,
+    TT.WHILE: _parse_while_statement,
+    TT.FUNC: _parse_func_def,
+    TT.RETURN: _parse_return_statement,
+}
+
+_FACTOR_DISPATCH: t.Final[dict[TT, t.Callable[["_TokenStream"], Expression]]] = {
+    TT.INTEGER: _parse_integer,
+    TT.FLOAT: _parse_float,
+    TT.TRUE: _parse_true,
+    TT.FALSE: _parse_false,
+    TT.CHAR: _parse_character,
+    TT.NAME: _parse_name_or_call,
+    TT.SUB: _parse_unaryop,
+    TT.ADD: _parse_unaryop,
+    TT.LOGICAL_NOT: _parse_unaryop,
+    TT.OPEN_PARENS: _parse_paren_expr,
+}
 
 
 class _TokenStream:
+    # The stream cursor is touched on every parser decision; slots plus the
+    # cached token count keep those accesses offset loads with no len() call.
+    __slots__ = ("_tokens", "_curr_token", "_n")
+
     def __init__(self, tokens: list[Token]) -> None:
         self._tokens = tokens
         self._curr_token = 0
+        self._n = len(tokens)
 
     def peek(self, toktype: TokenType) -> Token | None:
-        if self.eof():
-            return None
-
-        if self.current().type == toktype:
-            return self._tokens[self._curr_token]
+        # Inlined bounds check and token read: peek runs on almost every
+        # parser decision, and the eof()/current() calls tripled its cost.
+        i = self._curr_token
+        if i < self._n and (tok := self._tokens[i]).type == toktype:
+            return tok
+        return None
 
     def peek_one_of(self, *tok_types: TokenType) -> Token | None:
-        if self.eof():
-            return None
-
-        if self.current().type in tok_types:
-            return self._tokens[self._curr_token]
+        i = self._curr_token
+        if i < self._n and (tok := self._tokens[i]).type in tok_types:
+            return tok
+        return None
 
     def peek_all(self, *tok_types: TokenType) -> Token | None:
-        if self.eof():
+        pos = self._curr_token
+        tokens = self._tokens
+        if pos + len(tok_types) > self._n:
             return None
 
-        if self._curr_token + len(tok_types) >= len(self._tokens):
-            return None
+        for i, tok_type in enumerate(tok_types):
+            if tokens[pos + i].type != tok_type:
+                return None
+        return tokens[pos]
 
-        end = self._curr_token + len(tok_types)
-        all_match = all(
-            [
-                tok_exp_type[0].type == tok_exp_type[1]
-                for tok_exp_type in zip(self._tokens[self._curr_token : end], tok_types)
-            ]
-        )
-        if all_match:
-            return self._tokens[self._curr_token]
+    def advance(self) -> None:
+        """Consume the current token without re-checking its type.
+
+        For call sites that already matched it via `peek`/`current` - the
+        peek+expect pattern re-verifies the same token type twice.
+        """
+        self._curr_token += 1
 
     def expect(self, toktype: TokenType) -> Token:
         if self.current().type != toktype:
@@ -402,7 +482,7 @@ class _TokenStream:
         return self._tokens[self._curr_token]
 
     def eof(self) -> bool:
-        return self._curr_token >= len(self._tokens)
+        return self._curr_token >= self._n
 
     def print_debug_info(self) -> None:
         print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
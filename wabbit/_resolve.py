@@ -0,0 +1,135 @@
+"""Resolves variable names to integer slot indices.
+
+`_Interpreter.visit_Name` used to hash the variable name into a dict on every
+read - several string hashes per loop iteration in the hottest code. This pass
+runs once after parsing: it assigns each declared variable (and constant) a
+slot index within its scope and annotates `Name`/`VarDecl`/`ConstDecl`/
+`FuncArg` nodes with it, so the interpreter can back its execution context
+with a plain list.
+
+Wabbit scopes are flat per function (plus the global scope): `if`/`while`
+blocks do not introduce a new one. Declaration errors (re-declared or
+undefined names) surface here, before any code runs.
+"""
+
+from ._ast import *
+from ._errors import WabbitSyntaxError
+
+
+def resolve(ast: Node) -> Node:
+    """Annotate the AST with variable slot indices, in place."""
+    _Resolver().visit(ast)
+    return ast
+
+
+class _Resolver(Visitor):
+    def __init__(self) -> None:
+        super().__init__()
+        # name -> slot index for the scope currently being resolved.
+        self._scope: dict[str, int] = {}
+        # Names declared `const` in the current scope: assignments to them
+        # are rejected here so the interpreters need no per-write check.
+        self._consts: set[str] = set()
+
+    def visit_Integer(self, node: Integer) -> None:
+        pass
+
+    def visit_Float(self, node: Float) -> None:
+        pass
+
+    def visit_Boolean(self, node: Boolean) -> None:
+        pass
+
+    def visit_Character(self, node: Character) -> None:
+        pass
+
+    def visit_Name(self, node: Name) -> None:
+        try:
+            node.slot = self._scope[node.value]
+        except KeyError:
+            raise WabbitSyntaxError(f"Undefined variable '{node.value}'")
+
+    def visit_PrintStatement(self, node: PrintStatement) -> None:
+        self.visit(node.value)
+
+    def visit_BinOp(self, node: BinOp) -> None:
+        self.visit(node.left)
+        self.visit(node.right)
+
+    def visit_UnaryOp(self, node: UnaryOp) -> None:
+        self.visit(node.operand)
+
+    def visit_LogicalOp(self, node: LogicalOp) -> None:
+        self.visit(node.left)
+        self.visit(node.right)
+
+    def visit_ParenExpr(self, node: ParenExpr) -> None:
+        self.visit(node.value)
+
+    def visit_Statements(self, node: Statements) -> None:
+        for n in node.nodes:
+            self.visit(n)
+
+    def visit_ExprAsStatement(self, node: ExprAsStatement) -> None:
+        self.visit(node.expr)
+
+    def visit_VarDecl(self, node: VarDecl) -> None:
+        if node.value:
+            self.visit(node.value)
+        node.slot = self._declare(node.name.value)
+        node.name.slot = node.slot
+
+    def visit_ConstDecl(self, node: ConstDecl) -> None:
+        self.visit(node.value)
+        node.slot = self._declare(node.name.value)
+        node.name.slot = node.slot
+        self._consts.add(node.name.value)
+
+    def visit_Assignment(self, node: Assignment) -> None:
+        self.visit(node.right)
+        self.visit(node.left)
+        if isinstance(node.left, Name) and node.left.value in self._consts:
+            raise WabbitSyntaxError(
+                f"Cannot assign to constant '{node.left.value}'."
+            )
+
+    def visit_IfElse(self, node: IfElse) -> None:
+        self.visit(node.test)
+        self.visit(node.body)
+        if node.else_body:
+            self.visit(node.else_body)
+
+    def visit_While(self, node: While) -> None:
+        self.visit(node.test)
+        self.visit(node.body)
+
+    def visit_Break(self, node: Break) -> None:
+        pass
+
+    def visit_Continue(self, node: Continue) -> None:
+        pass
+
+    def visit_FuncDef(self, node: FuncDef) -> None:
+        # Function bodies only see their own arguments and locals.
+        outer_scope, outer_consts = self._scope, self._consts
+        self._scope, self._consts = {}, set()
+        for arg in node.args:
+            arg.slot = self._declare(arg.name.value)
+        self.visit(node.body)
+        node.local_count = len(self._scope)
+        self._scope, self._consts = outer_scope, outer_consts
+
+    def visit_Return(self, node: Return) -> None:
+        self.visit(node.value)
+
+    def visit_FuncCall(self, node: FuncCall) -> None:
+        # Functions are looked up by name, only the arguments need resolving.
+        for arg in node.args:
+            self.visit(arg)
+
+    def _declare(self, name: str) -> int:
+        if name in self._scope:
+            raise WabbitSyntaxError(f"Variable '{name}' was already declared.")
+        slot = len(self._scope)
+        self._scope[name] = slot
+        return slot
@@ -4,18 +4,18 @@ Usage:
 poetry run python -m wabbit.runit program.wb
 """
 
-import typer
-
-from ._parser import parse_file
-from ._compiler import Compiler
+from ._compiler import compile_cached
 
 
 def main(wabbit_file: str) -> None:
-    ast = parse_file(wabbit_file)
-    compiler = Compiler()
-    compiler.visit(ast)
-    print(compiler.to_llvm())
+    with open(wabbit_file) as f:
+        source = f.read()
+    print(compile_cached(source))
 
 
 if __name__ == "__main__":
+    # Imported here, not at module top: typer costs a noticeable chunk of
+    # startup time and is only needed when this file runs as a CLI.
+    import typer
+
     typer.run(main)
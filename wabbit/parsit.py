@@ -4,8 +4,6 @@ Usage:
 poetry run python -m wabbit.parsit program.wb
 """
 
-import typer
-
 from ._parser import parse_file
 
 
@@ -20,4 +18,8 @@ def main(wabbit_file: str) -> None:
 
 
 if __name__ == "__main__":
-    typer.run(main)
+    # Plain sys.argv instead of typer: the import alone dominated wall time
+    # for short programs, and this CLI takes a single file path.
+    import sys
+
+    main(sys.argv[1])
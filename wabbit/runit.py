@@ -4,18 +4,32 @@ Usage:
 poetry run python -m wabbit.runit program.wb
 """
 
-import typer
-
+from . import _codegen_py
 from ._parser import parse_file
 from ._interpret import _Interpreter
-from ._ast import *
+from ._optimize import fold_constants
+from ._resolve import resolve
 from ._errors import WabbitError
 
 
-def main(wabbit_file: str, debug: bool = False) -> None:
-    ast = parse_file(wabbit_file)
+def main(wabbit_file: str, debug: bool = False, bytecode: bool = False) -> None:
     interpreter = _Interpreter()
+    # Parsing and resolving sit inside the try as well: syntax and
+    # declaration errors should print the same clean `Error:` line as
+    # runtime ones.
     try:
+        ast = resolve(fold_constants(parse_file(wabbit_file)))
+
+        if bytecode:
+            # Compile the whole program to one CPython code object and run
+            # that; fall back to the interpreter when some node cannot be
+            # translated.
+            try:
+                _codegen_py.compile_program(ast)()
+                return
+            except _codegen_py.Unsupported:
+                pass
+
         interpreter.visit(ast)
     except WabbitError as e:
         if debug:
@@ -30,4 +44,13 @@ def main(wabbit_file: str, debug: bool = False) -> None:
 
 
 if __name__ == "__main__":
-    typer.run(main)
+    # Plain sys.argv instead of typer: the import alone dominated wall time
+    # for short programs, and this CLI is one file path plus two flags.
+    import sys
+
+    args = sys.argv[1:]
+    main(
+        args[0],
+        debug="--debug" in args,
+        bytecode="--bytecode" in args,
+    )